@@ -10,7 +10,7 @@ import os
 import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Callable
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from PySide6.QtCore import QObject, Signal, QStandardPaths, QThread
 
@@ -82,15 +82,17 @@ class ConfigManager(QObject):
         self._config_file = self._get_config_file_path()
         self._load_settings()
         
-        # Enhanced dependency checker with caching
-        self._dependency_checker = DependencyChecker(cache_ttl_minutes=10)
+        # Tool detection cache file, read and written only by the dependency checker
+        self._tool_detection_cache_file = self._config_file.parent / "tool_cache.json"
+        
+        # Enhanced dependency checker with caching, kept across restarts
+        self._dependency_checker = DependencyChecker(
+            cache_ttl_minutes=10, cache_file=self._tool_detection_cache_file
+        )
         
         # Background detection threading
         self._detection_thread = None
         self._detection_worker = None
-        
-        # Tool detection cache with persistence
-        self._tool_detection_cache_file = self._config_file.parent / "tool_cache.json"
     
     def _get_config_file_path(self) -> Path:
         """Get platform-appropriate configuration file path."""
@@ -250,8 +252,7 @@ class ConfigManager(QObject):
     
     def _on_background_detection_complete(self, results: Dict[str, ToolInfo]) -> None:
         """Handle background detection completion."""
-        # Save detection results to cache file
-        self._save_tool_detection_cache(results)
+        # Results are already persisted to tool_cache.json by the dependency checker
         
         # Update last detection time in settings
         tools_settings = self.get_settings("tools")
@@ -277,46 +278,6 @@ class ConfigManager(QObject):
         """Validate a tool path."""
         return self._dependency_checker.validate_tool_path(path, tool_name)
     
-    def _save_tool_detection_cache(self, results: Dict[str, ToolInfo]) -> None:
-        """Save tool detection results to cache file."""
-        try:
-            cache_data = {
-                "timestamp": datetime.now().isoformat(),
-                "results": {
-                    tool: info.to_dict() for tool, info in results.items()
-                }
-            }
-            
-            with open(self._tool_detection_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Failed to save tool detection cache: {e}")
-    
-    def _load_tool_detection_cache(self) -> Optional[Dict[str, ToolInfo]]:
-        """Load tool detection results from cache file."""
-        try:
-            if not self._tool_detection_cache_file.exists():
-                return None
-            
-            with open(self._tool_detection_cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # Check if cache is still valid (within 1 hour)
-            cache_time = datetime.fromisoformat(cache_data["timestamp"])
-            if datetime.now() - cache_time > timedelta(hours=1):
-                return None
-            
-            # Convert back to ToolInfo objects
-            results = {}
-            for tool, info_dict in cache_data["results"].items():
-                results[tool] = ToolInfo.from_dict(info_dict)
-            
-            return results
-            
-        except Exception as e:
-            print(f"Failed to load tool detection cache: {e}")
-            return None
-    
     def validate_current_settings(self) -> ValidationResult:
         """Validate current settings."""
         return SettingsSchema.validate_settings(self._settings)
@@ -25,6 +25,7 @@ from app.dialogs.settings_dialog import SettingsDialog
 from app.dialogs.progress_dialog import ProgressDialog
 from app.dialogs.sync_confirmation_dialog import SyncConfirmationDialog
 from app.config.config_manager import ConfigManager
+from app.config.settings_schema import LogLevel
 from app.runner import ScriptRunner, ExtractConfig, TranslateConfig, SyncConfig, Stage, EventType
 from app.zoom_manager import ZoomManager
 from app.window_state_manager import WindowStateManager
@@ -70,6 +71,7 @@ class MainWindow(QMainWindow):
         
         # Script runner for subprocess management
         self.script_runner = ScriptRunner(self)
+        self._apply_runner_debug_setting()
         
         # Window properties
         self.setWindowTitle(self.tr("SubtitleToolkit"))
@@ -787,6 +789,13 @@ class MainWindow(QMainWindow):
         # Update stage configurators with new settings
         if hasattr(self.stage_configurators, 'update_from_settings'):
             self.stage_configurators.update_from_settings(settings)
+        
+        self._apply_runner_debug_setting()
+    
+    def _apply_runner_debug_setting(self) -> None:
+        """Forward runner diagnostics to the log panel only at debug log level."""
+        advanced = self.config_manager.get_settings("advanced")
+        self.script_runner.debug_enabled = advanced.get("log_level") == LogLevel.DEBUG.value
     
     def _show_about(self) -> None:
         """Show about dialog."""
@@ -22,6 +22,7 @@ class ExtractConfig:
     # Processing options
     recursive: bool = True
     overwrite_existing: bool = False
+    merge_streams: bool = False  # Read stderr through stdout as one stream
     
     # Tool paths (from settings)
     ffmpeg_path: Optional[str] = None
@@ -116,6 +117,7 @@ class TranslateConfig:
     # Output options
     overwrite_existing: bool = False
     preserve_formatting: bool = True
+    merge_streams: bool = False  # Read stderr through stdout as one stream
     
     def validate(self) -> tuple[bool, str]:
         """Validate the translation configuration.
@@ -275,6 +277,7 @@ class SyncConfig:
     dry_run: bool = True  # Default to dry run for safety
     auto_backup_existing: bool = True  # Auto-rename existing target files to .original.srt
     recursive: bool = True
+    merge_streams: bool = False  # Read stderr through stdout as one stream
     naming_template: str = "{show_title} - S{season:02d}E{episode:02d} - {episode_title}"
 
     # Filtering options
@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, Dict, Any, List
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QMetaMethod
 
 
 class EventType(Enum):
@@ -28,7 +28,12 @@ class Stage(Enum):
     SYNC = "sync"
 
 
-@dataclass
+# Wire values of the JSONL schema mapped to their enum members
+_STAGE_BY_VALUE: Dict[str, Stage] = {stage.value: stage for stage in Stage}
+_EVENT_TYPE_BY_VALUE: Dict[str, EventType] = {event_type.value: event_type for event_type in EventType}
+
+
+@dataclass(slots=True)
 class Event:
     """
     Represents a single event from the JSONL stream.
@@ -55,14 +60,18 @@ class Event:
     def from_jsonl(cls, json_data: Dict[str, Any]) -> 'Event':
         """Create an Event from parsed JSON data."""
         try:
-            # Parse timestamp
-            timestamp = datetime.fromisoformat(json_data['ts'].replace('Z', '+00:00'))
+            # Parse timestamp (fromisoformat accepts the 'Z' suffix since Python 3.11)
+            timestamp = datetime.fromisoformat(json_data['ts'])
             
-            # Parse stage
-            stage = Stage(json_data['stage'])
+            # Parse stage and event type with plain lookups over the closed
+            # value sets instead of going through the Enum constructor
+            stage = _STAGE_BY_VALUE.get(json_data['stage'])
+            if stage is None:
+                raise ValueError(f"{json_data['stage']!r} is not a valid Stage")
             
-            # Parse event type
-            event_type = EventType(json_data['type'])
+            event_type = _EVENT_TYPE_BY_VALUE.get(json_data['type'])
+            if event_type is None:
+                raise ValueError(f"{json_data['type']!r} is not a valid EventType")
             
             # Extract message
             message = json_data['msg']
@@ -100,7 +109,7 @@ class Event:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessResult:
     """
     Result of a completed script execution.
@@ -160,6 +169,7 @@ class ScriptRunnerSignals(QObject):
     
     # Raw event signal for debugging/logging
     event_received = Signal(Event)  # raw event
+    events_batch_received = Signal(list)  # all events parsed from one stdout chunk
     
     # Stream parsing signals
     stream_data_received = Signal(str)  # raw_line
@@ -169,6 +179,33 @@ class ScriptRunnerSignals(QObject):
     process_output_received = Signal(str)  # stdout line
     process_error_received = Signal(str)  # stderr line
     process_cancelled = Signal(Stage)  # stage
+    
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        # Resolved once so the runner can skip building emits nobody listens to.
+        # Connection state is checked on demand: querying receivers() from
+        # connectNotify/disconnectNotify deadlocks when a slot is shared
+        # between signals.
+        self._output_signal = QMetaMethod.fromSignal(self.process_output_received)
+        self._error_signal = QMetaMethod.fromSignal(self.process_error_received)
+        self._event_signal = QMetaMethod.fromSignal(self.event_received)
+        self._batch_signal = QMetaMethod.fromSignal(self.events_batch_received)
+    
+    @property
+    def has_output_receivers(self) -> bool:
+        return self.isSignalConnected(self._output_signal)
+    
+    @property
+    def has_error_receivers(self) -> bool:
+        return self.isSignalConnected(self._error_signal)
+    
+    @property
+    def has_event_receivers(self) -> bool:
+        return self.isSignalConnected(self._event_signal)
+    
+    @property
+    def has_batch_receivers(self) -> bool:
+        return self.isSignalConnected(self._batch_signal)
 
 
 class EventAggregator:
@@ -223,6 +260,12 @@ class EventAggregator:
             self.result_data = event.data
             self.end_time = event.timestamp
     
+    def add_events(self, events: List[Event]):
+        """Add a batch of events, in stream order."""
+        add_event = self.add_event
+        for event in events:
+            add_event(event)
+    
     def get_progress_info(self) -> Dict[str, Any]:
         """Get current progress information."""
         return {
@@ -7,8 +7,13 @@ error handling, partial line buffering, and recovery mechanisms.
 
 import json
 import logging
-from typing import Iterator, Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple, Union
 from io import StringIO
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from PySide6.QtCore import QObject, QTextStream, QIODevice
 from PySide6.QtNetwork import QTcpSocket
@@ -16,6 +21,26 @@ from PySide6.QtNetwork import QTcpSocket
 from .events import Event, EventType, Stage
 
 
+# orjson parses UTF-8 bytes directly in C; both loaders accept str or bytes and
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Shared by every parser instance
+_LOGGER = logging.getLogger(f"{__name__}.JSONLParser")
+
+
+def _loads_line(line: Union[str, bytes]):
+    """Parse one JSONL line, decoding non-UTF-8 bytes leniently as text stdout is."""
+    try:
+        return _json_loads(line)
+    except ValueError:
+        # JSONDecodeError and UnicodeDecodeError; scripts printing to a
+        # non-UTF-8 console pipe (e.g. cp1252) still produce usable events
+        if not isinstance(line, bytes):
+            raise
+        return _json_loads(line.decode('utf-8', errors='replace'))
+
+
 class JSONLParser(QObject):
     """
     Robust JSONL stream parser with error recovery.
@@ -31,8 +56,9 @@ class JSONLParser(QObject):
     def __init__(self, parent: QObject = None):
         super().__init__(parent)
         
-        # Buffer for partial lines
-        self._buffer = ""
+        # Buffers for partial lines: unjoined text chunks and raw bytes
+        self._chunks: List[str] = []
+        self._bytes_buffer = bytearray()
         
         # Parsing statistics
         self._lines_processed = 0
@@ -40,7 +66,7 @@ class JSONLParser(QObject):
         self._parse_errors = 0
         
         # Logger for debugging
-        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._logger = _LOGGER
     
     def parse_stream_data(self, data: str) -> Iterator[Tuple[Event, Optional[str]]]:
         """
@@ -53,12 +79,21 @@ class JSONLParser(QObject):
             Tuple[Event, Optional[str]]: (parsed_event, error_message)
             If parsing fails, event will be None and error_message will contain details.
         """
-        # Add data to buffer
-        self._buffer += data
+        # Chunks without a newline are only collected; joining is deferred
+        # until a line completes so long lines are not copied on every feed
+        if '\n' not in data:
+            if data:
+                self._chunks.append(data)
+            return
+        
+        self._chunks.append(data)
+        buffer = ''.join(self._chunks)
+        end = buffer.rfind('\n')
+        tail = buffer[end + 1:]
+        self._chunks = [tail] if tail else []
         
         # Process complete lines
-        while '\n' in self._buffer:
-            line, self._buffer = self._buffer.split('\n', 1)
+        for line in buffer[:end].split('\n'):
             self._lines_processed += 1
             
             # Skip empty lines
@@ -69,24 +104,61 @@ class JSONLParser(QObject):
             event, error = self._parse_line(line)
             yield (event, error)
     
-    def _parse_line(self, line: str) -> Tuple[Optional[Event], Optional[str]]:
+    def parse_stream_bytes(self, data: Union[bytes, bytearray, memoryview]) -> Iterator[Tuple[Event, Optional[str]]]:
+        """
+        Parse incoming raw stdout bytes and yield events.
+        
+        Lines are split and parsed as UTF-8 bytes without first decoding the
+        chunk to ``str``; a multi-byte character split across chunks stays in
+        the byte buffer until its line is complete.
+        
+        Args:
+            data: Raw bytes (or any buffer, e.g. QByteArray) from subprocess stdout
+            
+        Yields:
+            Tuple[Event, Optional[str]]: (parsed_event, error_message)
+        """
+        buffer = self._bytes_buffer
+        scan_start = len(buffer)
+        buffer += data
+        
+        # The carried-over tail holds no newline, so only the new bytes are scanned
+        end = buffer.rfind(b'\n', scan_start)
+        if end < 0:
+            return
+        with memoryview(buffer) as view:
+            complete = view[:end].tobytes()
+        # Deleting from the front of a bytearray keeps the allocation for the tail
+        del buffer[:end + 1]
+        
+        for line in complete.split(b'\n'):
+            self._lines_processed += 1
+            
+            # Skip empty lines
+            if not line.strip():
+                continue
+            
+            yield self._parse_line(line)
+    
+    def _parse_line(self, line: Union[str, bytes]) -> Tuple[Optional[Event], Optional[str]]:
         """
         Parse a single line of JSONL data.
         
         Args:
-            line: Complete line from the stream
+            line: Complete line from the stream, as text or UTF-8 bytes
             
         Returns:
             Tuple[Optional[Event], Optional[str]]: (parsed_event, error_message)
         """
         try:
-            # Try to parse as JSON
-            json_data = json.loads(line.strip())
+            # Try to parse as JSON; surrounding whitespace (including a CR
+            # from CRLF output) is valid JSON, so the line is not stripped first
+            json_data = _loads_line(line)
             
             # Validate it has the expected structure
             if not isinstance(json_data, dict):
                 self._parse_errors += 1
-                return None, f"JSONL line is not a JSON object: {line[:100]}..."
+                return None, f"JSONL line is not a JSON object: {self._preview(line)}..."
             
             # Create Event object
             event = Event.from_jsonl(json_data)
@@ -96,22 +168,29 @@ class JSONLParser(QObject):
             
         except json.JSONDecodeError as e:
             self._parse_errors += 1
-            error_msg = f"JSON decode error: {e}. Line: {line[:100]}..."
+            error_msg = f"JSON decode error: {e}. Line: {self._preview(line)}..."
             self._logger.warning(error_msg)
             return None, error_msg
             
         except ValueError as e:
             self._parse_errors += 1
-            error_msg = f"Event validation error: {e}. Line: {line[:100]}..."
+            error_msg = f"Event validation error: {e}. Line: {self._preview(line)}..."
             self._logger.warning(error_msg)
             return None, error_msg
             
         except Exception as e:
             self._parse_errors += 1
-            error_msg = f"Unexpected parsing error: {e}. Line: {line[:100]}..."
+            error_msg = f"Unexpected parsing error: {e}. Line: {self._preview(line)}..."
             self._logger.error(error_msg)
             return None, error_msg
     
+    @staticmethod
+    def _preview(line: Union[str, bytes]) -> str:
+        """First 100 characters of a line for error messages."""
+        if isinstance(line, bytes):
+            return line[:100].decode('utf-8', errors='replace')
+        return line[:100]
+    
     def flush_buffer(self) -> Iterator[Tuple[Optional[Event], Optional[str]]]:
         """
         Flush any remaining data in the buffer.
@@ -122,15 +201,22 @@ class JSONLParser(QObject):
         Yields:
             Tuple[Optional[Event], Optional[str]]: Any events parsed from buffer
         """
-        if self._buffer.strip():
+        remaining = ''.join(self._chunks)
+        self._chunks = []
+        if remaining.strip():
             # Try to parse any remaining data
-            event, error = self._parse_line(self._buffer)
+            event, error = self._parse_line(remaining)
+            yield (event, error)
+        
+        if self._bytes_buffer.strip():
+            event, error = self._parse_line(bytes(self._bytes_buffer))
             yield (event, error)
-            self._buffer = ""
+        self._bytes_buffer.clear()
     
     def reset(self):
         """Reset parser state for reuse."""
-        self._buffer = ""
+        self._chunks = []
+        self._bytes_buffer.clear()
         self._lines_processed = 0
         self._events_parsed = 0
         self._parse_errors = 0
@@ -141,7 +227,7 @@ class JSONLParser(QObject):
             'lines_processed': self._lines_processed,
             'events_parsed': self._events_parsed,
             'parse_errors': self._parse_errors,
-            'buffer_size': len(self._buffer),
+            'buffer_size': sum(map(len, self._chunks)) + len(self._bytes_buffer),
             'success_rate': (self._events_parsed / max(self._lines_processed, 1)) * 100
         }
 
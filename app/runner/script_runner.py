@@ -6,13 +6,19 @@ process lifecycle management, and Qt signal integration.
 """
 
 import os
+import re
+import atexit
+import codecs
+import functools
 import sys
 import logging
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Callable
 
-from PySide6.QtCore import QObject, QProcess, QTimer, QThread
+from PySide6.QtCore import QObject, QProcess, QProcessEnvironment, QTimer, QThread, Signal, Slot
 from PySide6.QtWidgets import QApplication
 
 from .config_models import ExtractConfig, TranslateConfig, SyncConfig
@@ -20,6 +26,237 @@ from .events import Event, EventType, Stage, ProcessResult, EventAggregator, Scr
 from .jsonl_parser import JSONLParser
 
 
+# Shared by every runner instance
+_LOGGER = logging.getLogger(f"{__name__}.ScriptRunner")
+
+# Environment variable names whose values must never appear in debug output
+_SECRET_KEY_RE = re.compile(r'key|token|secret|password', re.IGNORECASE)
+
+# Finished QProcess objects kept for reuse by the next stage
+_PROCESS_POOL_SIZE = 2
+
+# Window over which readyReadStandardOutput bursts are drained together, in milliseconds
+_STDOUT_COALESCE_MS = 10
+
+# Bytes of recent stdout kept for get_output_tail()
+_OUTPUT_TAIL_LIMIT = 256 * 1024
+
+# Grace period after terminate() before cleanup kills a still-running process
+_CLEANUP_KILL_DELAY_MS = 1000
+
+# Minimum interval between progress_updated emissions, in milliseconds
+_PROGRESS_THROTTLE_MS = 50
+
+# Human-readable meaning of common script exit codes, for crash diagnostics
+_EXIT_CODE_DESCRIPTIONS: Dict[int, str] = {
+    15: "SIGTERM - Process was terminated",
+    9: "SIGKILL - Process was forcibly killed",
+    139: "SIGSEGV - Segmentation fault",
+    2: "File not found or permission denied",
+    1: "General error",
+}
+
+# User-facing message for each QProcess error
+_PROCESS_ERROR_MESSAGES: Dict[QProcess.ProcessError, str] = {
+    QProcess.FailedToStart: "Failed to start process",
+    QProcess.Crashed: "Process crashed",
+    QProcess.Timedout: "Process timed out",
+    QProcess.WriteError: "Write error",
+    QProcess.ReadError: "Read error",
+    QProcess.UnknownError: "Unknown error",
+}
+
+# Most aggregated error messages joined into a failed ProcessResult
+_MAX_REPORTED_ERRORS = 20
+
+# Longest slice of captured output copied into a single debug line
+_DEBUG_TEXT_LIMIT = 2048
+
+
+def _truncated_text(text: str, limit: int = _DEBUG_TEXT_LIMIT) -> str:
+    """At most ``limit`` characters of ``text``, noting how much was cut."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...(+{len(text) - limit} chars)"
+
+
+# CLI script run for each pipeline stage
+_STAGE_SCRIPTS: Dict[Stage, str] = {
+    Stage.EXTRACT: "extract_mkv_subtitles.py",
+    Stage.TRANSLATE: "srtTranslateWhole.py",
+    Stage.SYNC: "srt_names_sync.py",
+}
+
+# Scripts that must all be present for a directory to count as the scripts dir
+_REQUIRED_SCRIPTS = frozenset(_STAGE_SCRIPTS.values())
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_script_dir() -> Path:
+    """Find the scripts directory relative to the application (cached per process)."""
+    # Try different possible locations
+    possible_paths = [
+        # Development environment
+        Path(__file__).parent.parent.parent / "scripts",
+        # Packaged application
+        Path(sys.executable).parent / "scripts",
+        Path(QApplication.applicationDirPath()) / "scripts",
+        # Fallback - current directory
+        Path.cwd() / "scripts"
+    ]
+    
+    for path in possible_paths:
+        # One directory listing per candidate instead of a stat per script
+        try:
+            with os.scandir(path) as entries:
+                # is_file() is answered from the directory entry type, no extra stat
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            continue
+        
+        if _REQUIRED_SCRIPTS <= names:
+            _LOGGER.info("Found scripts directory: %s", path)
+            return path
+    
+    # Fallback to assuming scripts are in parent directory
+    fallback_path = Path(__file__).parent.parent.parent / "scripts"
+    _LOGGER.warning("Scripts directory not found, using fallback: %s", fallback_path)
+    return fallback_path
+
+
+@functools.lru_cache(maxsize=1)
+def _system_environment() -> QProcessEnvironment:
+    """Snapshot of the application environment, parsed once per process.
+    
+    Callers copy it before inserting variables; the copy is implicitly
+    shared until modified.
+    """
+    return QProcessEnvironment.systemEnvironment()
+
+
+class _OnceFlag:
+    """Test-and-set flag letting only the first completion callback through."""
+    
+    __slots__ = ('_lock', '_set')
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._set = False
+    
+    def test_and_set(self) -> bool:
+        """Set the flag and return whether it was already set."""
+        with self._lock:
+            was_set = self._set
+            self._set = True
+            return was_set
+    
+    def is_set(self) -> bool:
+        return self._set
+    
+    def clear(self):
+        with self._lock:
+            self._set = False
+
+
+_parser_thread: Optional[QThread] = None
+
+
+def _shared_parser_thread() -> QThread:
+    """Return the background thread hosting JSONL parser workers, starting it on first use."""
+    global _parser_thread
+    if _parser_thread is None:
+        _parser_thread = QThread()
+        _parser_thread.setObjectName("ScriptRunnerParser")
+        _parser_thread.start()
+        atexit.register(_stop_parser_thread)
+    return _parser_thread
+
+
+def _stop_parser_thread():
+    """Stop the shared parser thread at interpreter exit."""
+    global _parser_thread
+    if _parser_thread is not None:
+        _parser_thread.quit()
+        _parser_thread.wait(2000)
+        _parser_thread = None
+
+
+def _release_parser_worker(worker: "_ParserWorker", *_):
+    """Delete a runner's parser worker on the parser thread once the runner is gone."""
+    try:
+        worker.deleteLater()
+    except RuntimeError:
+        # Already deleted, e.g. after the parser thread stopped at exit
+        pass
+
+
+class _ParserWorker(QObject):
+    """
+    Parses JSONL stdout on the shared parser thread.
+    
+    Requests and results carry the runner's job generation; the parser is
+    reset whenever a new generation arrives, and the runner drops results
+    belonging to a job it has already cleaned up. The parser itself is only
+    touched on the parser thread; other threads read the statistics snapshot
+    published after each request.
+    """
+    
+    parsed = Signal(int, str, object)  # generation, data, [(event, error), ...]
+    parse_failed = Signal(int, str, str)  # generation, data, error_message
+    flushed = Signal(int, object, str)  # generation, [(event, error), ...], error_message
+    
+    def __init__(self):
+        super().__init__()
+        self.parser = JSONLParser(self)
+        self._generation = -1
+        self._stats_lock = threading.Lock()
+        self._stats = self.parser.get_stats()
+    
+    def get_stats(self) -> dict:
+        """Get the parser statistics as of the last request (any thread)."""
+        with self._stats_lock:
+            return dict(self._stats)
+    
+    def _publish_stats(self):
+        stats = self.parser.get_stats()
+        with self._stats_lock:
+            self._stats = stats
+    
+    def _sync_generation(self, generation: int):
+        if generation != self._generation:
+            self.parser.reset()
+            self._generation = generation
+    
+    @Slot(int, bytes)
+    def parse(self, generation: int, data: bytes):
+        """Parse a raw stdout chunk and send the results back."""
+        self._sync_generation(generation)
+        try:
+            results = list(self.parser.parse_stream_bytes(data))
+        except Exception as e:
+            self._publish_stats()
+            self.parse_failed.emit(generation, data.decode('utf-8', errors='replace'), str(e))
+            return
+        self._publish_stats()
+        if results:
+            # The chunk text only accompanies results that contain parse errors
+            text = ""
+            if any(error for _, error in results):
+                text = data.decode('utf-8', errors='replace')
+            self.parsed.emit(generation, text, results)
+    
+    @Slot(int)
+    def flush(self, generation: int):
+        """Parse whatever is left in the buffer and report completion."""
+        self._sync_generation(generation)
+        try:
+            results, error = list(self.parser.flush_buffer()), ""
+        except Exception as e:
+            results, error = [], str(e)
+        self._publish_stats()
+        self.flushed.emit(generation, results, error)
+
+
 class ScriptRunner(QObject):
     """
     Main orchestrator for running SubtitleToolkit CLI scripts.
@@ -33,6 +270,10 @@ class ScriptRunner(QObject):
     - Thread-safe operations
     """
     
+    # Requests to the parser worker (delivered queued on the parser thread)
+    _parse_requested = Signal(int, bytes)  # generation, raw stdout chunk
+    _flush_requested = Signal(int)  # generation
+    
     def __init__(self, parent: QObject = None):
         super().__init__(parent)
         
@@ -44,19 +285,72 @@ class ScriptRunner(QObject):
         self._current_stage: Optional[Stage] = None
         self._current_config: Optional[Any] = None
         
-        # JSONL parser
-        self._parser = JSONLParser(self)
+        # JSONL parsing runs on a worker living on the shared parser thread.
+        # The worker has no parent there, so it is released with deleteLater()
+        # when this runner is destroyed.
+        self._parser_worker = _ParserWorker()
+        self._parser_worker.moveToThread(_shared_parser_thread())
+        self.destroyed.connect(functools.partial(_release_parser_worker, self._parser_worker))
+        self._parse_generation = 0
+        self._after_parser_flush: Optional[Callable[[], None]] = None
+        self._parse_requested.connect(self._parser_worker.parse)
+        self._flush_requested.connect(self._parser_worker.flush)
+        self._parser_worker.parsed.connect(self._on_events_parsed)
+        self._parser_worker.parse_failed.connect(self._on_parse_failed)
+        self._parser_worker.flushed.connect(self._on_parser_flushed)
+        
+        # Event type -> signal emitter, built once for constant-time dispatch
+        self._event_dispatch = {
+            EventType.INFO: self._emit_info,
+            EventType.PROGRESS: self._emit_progress,
+            EventType.WARNING: self._emit_warning,
+            EventType.ERROR: self._emit_error,
+            EventType.RESULT: self._emit_result,
+        }
+        
+        # Reusable byte buffer and incremental decoders for stdout/stderr; the
+        # decoders keep split multi-byte UTF-8 sequences between reads. stdout
+        # is parsed as bytes, so its decoder only feeds text listeners.
+        self._stdout_bytes_buf = bytearray()
+        # Raw tail of the current job's stdout, decoded only when requested
+        self._output_tail: deque = deque()
+        self._output_tail_size = 0
+        self._stdout_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._stderr_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
+        # Re-entry guards for the output handlers
+        self._in_stdout_ready = False
+        self._in_stderr_ready = False
         
         # Event aggregator for progress tracking
         self._aggregator: Optional[EventAggregator] = None
+        # Aggregator progress snapshot for get_process_info, dropped on every new event
+        self._cached_progress_info: Optional[Dict[str, Any]] = None
         
-        # Process start time for duration tracking
-        self._process_start_time: Optional[datetime] = None
+        # Process start time (wall clock) and monotonic start for duration tracking
+        self._process_start_time: Optional[float] = None  # time.monotonic() at start
         
         # Process completion state tracking
-        self._process_completing = False
         self._final_output_read = False
-        self._completion_handled = False  # Prevents duplicate signal handling
+        self._completion_flag = _OnceFlag()  # Prevents duplicate signal handling
+        
+        # Progress throttling: latest update held back within a window
+        self._pending_progress: Optional[tuple] = None
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
+        
+        # Stdout bursts are coalesced and drained once per tick
+        self._stdout_coalesce_timer = QTimer(self)
+        self._stdout_coalesce_timer.setSingleShot(True)
+        self._stdout_coalesce_timer.setInterval(_STDOUT_COALESCE_MS)
+        self._stdout_coalesce_timer.timeout.connect(self._on_stdout_ready)
+        
+        # One aggregator per stage, reset and reused for each run
+        self._aggregators: Dict[Stage, EventAggregator] = {}
+        
+        # Idle QProcess objects reused across stages instead of reallocated
+        self._process_pool: deque = deque()
         
         # Termination timeout timer
         self._termination_timer = QTimer(self)
@@ -64,47 +358,59 @@ class ScriptRunner(QObject):
         self._termination_timer.timeout.connect(self._force_kill_process)
         
         # Logger
-        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._logger = _LOGGER
+        
+        # Internal diagnostics are only emitted via debug_received when enabled
+        self._debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
         
         # Determine script paths
-        self._script_dir = self._find_script_directory()
-    
-    def _find_script_directory(self) -> Path:
-        """Find the scripts directory relative to the application."""
-        # Try different possible locations
-        possible_paths = [
-            # Development environment
-            Path(__file__).parent.parent.parent / "scripts",
-            # Packaged application
-            Path(sys.executable).parent / "scripts",
-            Path(QApplication.applicationDirPath()) / "scripts",
-            # Fallback - current directory
-            Path.cwd() / "scripts"
-        ]
-        
-        for path in possible_paths:
-            if path.exists() and path.is_dir():
-                # Check if required scripts exist
-                required_scripts = [
-                    "extract_mkv_subtitles.py",
-                    "srtTranslateWhole.py", 
-                    "srt_names_sync.py"
-                ]
-                
-                if all((path / script).exists() for script in required_scripts):
-                    self._logger.info(f"Found scripts directory: {path}")
-                    return path
+        self._script_dir = _resolve_script_dir()
         
-        # Fallback to assuming scripts are in parent directory
-        fallback_path = Path(__file__).parent.parent.parent / "scripts"
-        self._logger.warning(f"Scripts directory not found, using fallback: {fallback_path}")
-        return fallback_path
+        # Interpreter and script path per stage, built on first use for the
+        # script directory object they were derived from
+        self._stage_commands: Dict[Stage, tuple] = {}
+        self._stage_commands_dir: Optional[Path] = None
+    
+    def _stage_command(self, stage: Stage) -> tuple:
+        """Interpreter and script path for a stage, rebuilt only if the script dir changes."""
+        if self._stage_commands_dir is not self._script_dir:
+            self._stage_commands = {
+                each: (sys.executable, os.fspath(self._script_dir / script))
+                for each, script in _STAGE_SCRIPTS.items()
+            }
+            self._stage_commands_dir = self._script_dir
+        return self._stage_commands[stage]
+    
+    @classmethod
+    def reset_script_dir_cache(cls):
+        """Forget the resolved scripts directory so the next runner searches again."""
+        _resolve_script_dir.cache_clear()
+    
+    @staticmethod
+    def _mask_secret(value: str) -> str:
+        """Mask a secret value, keeping only a short prefix and suffix."""
+        return f"{value[:8]}***{value[-4:]}" if len(value) > 12 else "***"
+    
+    @staticmethod
+    def _mask_if_secret(key: str, value: str) -> str:
+        """Mask an environment variable value if its name looks like a secret."""
+        return ScriptRunner._mask_secret(value) if _SECRET_KEY_RE.search(key) else value
     
     @property
     def is_running(self) -> bool:
         """Check if a process is currently running."""
+        # Starting counts as running: start() returns before the child is up
         return (self._current_process is not None and 
-                self._current_process.state() == QProcess.Running)
+                self._current_process.state() != QProcess.NotRunning)
+    
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether internal diagnostic messages are emitted via debug_received."""
+        return self._debug_enabled
+    
+    @debug_enabled.setter
+    def debug_enabled(self, enabled: bool):
+        self._debug_enabled = bool(enabled)
     
     @property
     def current_stage(self) -> Optional[Stage]:
@@ -119,29 +425,13 @@ class ScriptRunner(QObject):
             config: Extract configuration
             
         Returns:
-            QProcess: The started process
+            QProcess: The process being started; startup is reported through
+            signals.process_started, or signals.process_failed if it cannot start
             
         Raises:
             RuntimeError: If another process is already running or config is invalid
         """
-        if self.is_running:
-            raise RuntimeError("Another process is already running")
-        
-        # Validate configuration
-        is_valid, error_msg = config.validate()
-        if not is_valid:
-            raise RuntimeError(f"Configuration validation failed: {error_msg}")
-        
-        # Set up for extraction
-        self._current_stage = Stage.EXTRACT
-        self._current_config = config
-        
-        # Build command
-        script_path = self._script_dir / "extract_mkv_subtitles.py"
-        command = [sys.executable, str(script_path)] + config.to_cli_args()
-        
-        # Start process
-        return self._start_process(command, config.get_env_vars() if hasattr(config, 'get_env_vars') else {})
+        return self._run(Stage.EXTRACT, config)
     
     def run_translate(self, config: TranslateConfig) -> QProcess:
         """
@@ -151,51 +441,13 @@ class ScriptRunner(QObject):
             config: Translation configuration
             
         Returns:
-            QProcess: The started process
+            QProcess: The process being started; startup is reported through
+            signals.process_started, or signals.process_failed if it cannot start
             
         Raises:
             RuntimeError: If another process is already running or config is invalid
         """
-        if self.is_running:
-            raise RuntimeError("Another process is already running")
-        
-        # Set up for translation (need stage for debugging)
-        self._current_stage = Stage.TRANSLATE
-        self._current_config = config
-        
-        # Validate configuration with detailed debugging
-        is_valid, error_msg = config.validate()
-        if not is_valid:
-            # Add detailed debugging information
-            self.signals.debug_received.emit(self._current_stage, f"TRANSLATION_VALIDATION_FAILED: {error_msg}")
-            self.signals.debug_received.emit(self._current_stage, f"CONFIG_PROVIDER: {config.provider}")
-            self.signals.debug_received.emit(self._current_stage, f"CONFIG_MODEL: {config.model}")
-            self.signals.debug_received.emit(self._current_stage, f"CONFIG_API_KEY_SET: {'Yes' if config.api_key else 'No'}")
-            if config.api_key:
-                # Show masked API key for debugging
-                masked_key = f"{config.api_key[:8]}***{config.api_key[-4:]}" if len(config.api_key) > 12 else "***"
-                self.signals.debug_received.emit(self._current_stage, f"CONFIG_API_KEY_MASKED: {masked_key}")
-            self.signals.debug_received.emit(self._current_stage, f"CONFIG_INPUT_FILES: {config.input_files}")
-            self.signals.debug_received.emit(self._current_stage, f"CONFIG_INPUT_DIRECTORY: {config.input_directory}")
-            
-            # Reset stage since we're failing
-            self._current_stage = None
-            self._current_config = None
-            
-            raise RuntimeError(f"Translation configuration validation failed: {error_msg}")
-        
-        # Handle multiple input files by running script multiple times
-        # For now, handle single file or directory mode
-        cli_args = config.to_cli_args()
-        if not cli_args:  # Multiple files case
-            raise RuntimeError("Multiple file translation not yet implemented")
-        
-        # Build command
-        script_path = self._script_dir / "srtTranslateWhole.py"
-        command = [sys.executable, str(script_path)] + cli_args
-        
-        # Start process
-        return self._start_process(command, config.get_env_vars())
+        return self._run(Stage.TRANSLATE, config)
     
     def run_sync(self, config: SyncConfig) -> QProcess:
         """
@@ -205,47 +457,97 @@ class ScriptRunner(QObject):
             config: Sync configuration
             
         Returns:
-            QProcess: The started process
+            QProcess: The process being started; startup is reported through
+            signals.process_started, or signals.process_failed if it cannot start
             
         Raises:
             RuntimeError: If another process is already running or config is invalid
         """
-        if self.is_running:
+        return self._run(Stage.SYNC, config)
+    
+    def _run(self, stage: Stage, config: Any) -> QProcess:
+        """
+        Validate a stage configuration and start the stage's script.
+        
+        Args:
+            stage: Processing stage to run
+            config: Configuration for the stage
+            
+        Returns:
+            QProcess: The process being started; startup is reported through
+            signals.process_started, or signals.process_failed if it cannot start
+            
+        Raises:
+            RuntimeError: If another process is already running or config is invalid
+        """
+        # A job whose process has exited stays busy until its completion is
+        # reported: the final drain and parser flush still use its state
+        if self._current_process is not None or self._completion_flag.is_set():
             raise RuntimeError("Another process is already running")
         
         # Validate configuration
         is_valid, error_msg = config.validate()
         if not is_valid:
+            if stage == Stage.TRANSLATE:
+                self._emit_translate_validation_debug(config, error_msg)
+                raise RuntimeError(f"Translation configuration validation failed: {error_msg}")
             raise RuntimeError(f"Configuration validation failed: {error_msg}")
         
-        # Set up for sync
-        self._current_stage = Stage.SYNC
+        # Handle multiple input files by running script multiple times
+        # For now, handle single file or directory mode
+        cli_args = config.to_cli_args()
+        if not cli_args:  # Multiple files case
+            raise RuntimeError("Multiple file translation not yet implemented")
+        
+        # Set up for the stage
+        self._current_stage = stage
         self._current_config = config
         
         # Build command
-        script_path = self._script_dir / "srt_names_sync.py"
-        command = [sys.executable, str(script_path)] + config.to_cli_args()
+        command = [*self._stage_command(stage), *cli_args]
         
         # Start process
-        return self._start_process(command, config.get_env_vars())
+        return self._start_process(command, config.get_env_vars(), config.merge_streams)
+    
+    def _emit_translate_validation_debug(self, config: TranslateConfig, error_msg: str):
+        """Emit detailed debugging information for a failed translation config."""
+        stage = Stage.TRANSLATE
+        self.signals.debug_received.emit(stage, f"TRANSLATION_VALIDATION_FAILED: {error_msg}")
+        self.signals.debug_received.emit(stage, f"CONFIG_PROVIDER: {config.provider}")
+        self.signals.debug_received.emit(stage, f"CONFIG_MODEL: {config.model}")
+        self.signals.debug_received.emit(stage, f"CONFIG_API_KEY_SET: {'Yes' if config.api_key else 'No'}")
+        if config.api_key:
+            # Show masked API key for debugging
+            self.signals.debug_received.emit(stage, f"CONFIG_API_KEY_MASKED: {self._mask_secret(config.api_key)}")
+        self.signals.debug_received.emit(stage, f"CONFIG_INPUT_FILES: {config.input_files}")
+        self.signals.debug_received.emit(stage, f"CONFIG_INPUT_DIRECTORY: {config.input_directory}")
     
-    def _start_process(self, command: List[str], env_vars: Dict[str, str]) -> QProcess:
+    def _start_process(self, command: List[str], env_vars: Dict[str, str],
+                       merge_channels: bool = False) -> QProcess:
         """
         Start a new QProcess with the given command.
         
+        Start-up is asynchronous: success arrives via started and failure via
+        errorOccurred (FailedToStart), so the GUI thread never blocks here.
+        
         Args:
             command: Command and arguments to execute
             env_vars: Environment variables to set
+            merge_channels: Read stderr through the stdout pipe instead of separately
             
         Returns:
-            QProcess: The started process
+            QProcess: The process being started
         """
-        # Create new process
-        process = QProcess(self)
+        # Reuse an idle process object when one is available
+        process = self._acquire_process()
         self._current_process = process
         
-        # Note: Environment variables are now handled through shell exports in the command
-        # This avoids issues with QProcess environment variable handling in shell mode
+        # Custom variables are layered over the inherited environment; set on
+        # every start so a pooled process never keeps a previous stage's keys
+        env = QProcessEnvironment(_system_environment())
+        for key, value in env_vars.items():
+            env.insert(key, value)
+        process.setProcessEnvironment(env)
         
         # Set working directory to script directory
         process.setWorkingDirectory(str(self._script_dir))
@@ -253,302 +555,256 @@ class ScriptRunner(QObject):
         # Set process to read output immediately and not buffer
         process.setReadChannel(QProcess.StandardOutput)
         
-        # Enable process channel mode to handle stdout/stderr separately
-        process.setProcessChannelMode(QProcess.SeparateChannels)
+        # Handle stdout/stderr separately unless the stage asked for one merged
+        # stream; set on every start since pooled processes keep the mode
+        process.setProcessChannelMode(
+            QProcess.MergedChannels if merge_channels else QProcess.SeparateChannels
+        )
         
         # Note: Using default process output handling for better stability
         
-        # Enable shell execution to handle special characters in paths properly
-        # Use shell to execute the command with proper quoting and environment variables
-        env_exports = " && ".join(f'export {key}="{value}"' for key, value in env_vars.items())
-        shell_command = " ".join(f'"{arg}"' for arg in command)
-        
-        # If we have environment variables, prepend them to the command
-        if env_exports:
-            full_command = f"{env_exports} && {shell_command}"
-        else:
-            full_command = shell_command
-            
-        process.setProgram("/bin/bash")
-        process.setArguments(["-c", full_command])
-        
-        # Debug: Show the actual shell command being executed
-        if self._current_stage:
-            if env_exports:
-                # Mask API keys in debug output
-                masked_exports = []
-                for key, value in env_vars.items():
-                    if 'api_key' in key.lower() or 'key' in key.lower():
-                        masked_value = f"{value[:8]}***{value[-4:]}" if len(value) > 12 else "***"
-                        masked_exports.append(f'export {key}="{masked_value}"')
-                    else:
-                        masked_exports.append(f'export {key}="{value}"')
-                masked_env_exports = " && ".join(masked_exports)
-                self.signals.debug_received.emit(self._current_stage, f"ENV_EXPORTS: {masked_env_exports}")
-            
-            self.signals.debug_received.emit(self._current_stage, f"SHELL_COMMAND: {shell_command}")
-            self.signals.debug_received.emit(self._current_stage, f"FULL_COMMAND: Using shell execution with environment variables")
-        
-        # Connect signals with queued connections for thread safety
-        process.readyReadStandardOutput.connect(self._on_stdout_ready)
-        process.readyReadStandardError.connect(self._on_stderr_ready)
-        process.finished.connect(self._on_process_finished)
-        process.errorOccurred.connect(self._on_process_error)
-        process.started.connect(self._on_process_started)
-        
-        # Connect aboutToClose signal to handle graceful shutdown
-        process.aboutToClose.connect(self._on_process_about_to_close)
+        # Run the interpreter directly; arguments are passed as-is, so paths
+        # with spaces, quotes or shell metacharacters need no quoting
+        process.setProgram(command[0])
+        process.setArguments(command[1:])
         
-        # Set up parser and aggregator
-        self._parser.reset()
+        # Set up parser and aggregator (a new generation resets the worker's parser)
+        self._parse_generation += 1
+        self._reset_output_buffers()
+        self._output_tail.clear()
+        self._output_tail_size = 0
         if self._current_stage:
-            self._aggregator = EventAggregator(self._current_stage)
-        
-        # Start process
-        command_str = ' '.join(command)
-        self._logger.info(f"Starting process: {command_str}")
-        
-        # Emit debug info to UI
-        if self._current_stage:
-            self.signals.debug_received.emit(self._current_stage, f"Executing command: {command_str}")
-            self.signals.debug_received.emit(self._current_stage, f"Working directory: {self._script_dir}")
-            self.signals.debug_received.emit(self._current_stage, f"Environment variables: {len(env_vars)} custom vars")
-            
-            # Show ALL environment variables (including system ones for debugging)
-            full_env = QProcess.systemEnvironment()
-            for env_entry in full_env:
-                if '=' in env_entry:
-                    key, value = env_entry.split('=', 1)
-                    if key in env_vars:
-                        # This is one of our custom env vars
-                        if 'api_key' in key.lower() or 'key' in key.lower():
-                            masked_value = f"{value[:8]}***{value[-4:]}" if len(value) > 12 else "***"
-                            self.signals.debug_received.emit(self._current_stage, f"CUSTOM_ENV: {key}={masked_value}")
-                        else:
-                            self.signals.debug_received.emit(self._current_stage, f"CUSTOM_ENV: {key}={value}")
-            
+            aggregator = self._aggregators.get(self._current_stage)
+            if aggregator is None:
+                aggregator = self._aggregators[self._current_stage] = EventAggregator(self._current_stage)
+            else:
+                aggregator.reset()
+            self._aggregator = aggregator
+        self._cached_progress_info = None
+        
+        # Start process (the joined command line is only built for logging)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("Starting process: %s", " ".join(command))
+        
+        # Send the launch details to the debug log as one message
+        stage = self._current_stage
+        if self._debug_enabled and stage:
+            debug_lines = [
+                f"Executing command: {' '.join(command)}",
+                f"Working directory: {self._script_dir}",
+                f"Environment variables: {len(env_vars)} custom vars",
+            ]
             # Show environment variable details (without showing actual API keys)
             for key, value in env_vars.items():
-                if 'api_key' in key.lower() or 'key' in key.lower():
-                    masked_value = f"{value[:8]}***{value[-4:]}" if len(value) > 12 else "***"
-                    self.signals.debug_received.emit(self._current_stage, f"SET_ENV: {key}={masked_value}")
-                else:
-                    self.signals.debug_received.emit(self._current_stage, f"SET_ENV: {key}={value}")
-            
-            self.signals.debug_received.emit(self._current_stage, f"Starting process with PID will be assigned...")
+                debug_lines.append(f"SET_ENV: {key}={self._mask_if_secret(key, value)}")
+            self._emit_debug_batch(stage, debug_lines)
         
-        self._process_start_time = datetime.now()
-        
-        # Add immediate debugging right before starting process
-        if self._current_stage:
-            self.signals.debug_received.emit(self._current_stage, f"About to start: {command[0]} with {len(command)-1} arguments")
-            # Show all arguments for debugging
-            for i, arg in enumerate(command):
-                self.signals.debug_received.emit(self._current_stage, f"ARG[{i}]: {repr(arg)}")
+        self._process_start_time = time.monotonic()
         
         # Start the shell process (program and arguments already set above)
         process.start()
         
-        if not process.waitForStarted(5000):  # 5 second timeout
-            error_msg = f"Failed to start process: {process.errorString()}"
-            self._logger.error(error_msg)
-            if self._current_stage:
-                self.signals.debug_received.emit(self._current_stage, f"FAILED TO START: {error_msg}")
-            self._cleanup_process()
-            raise RuntimeError(error_msg)
-        
-        # Add debugging right after successful start
-        if self._current_stage:
-            self.signals.debug_received.emit(self._current_stage, f"Process started successfully, waiting for first output...")
-            
-            # Give the process a very short time to produce initial output or fail
-            if process.waitForFinished(100):  # Wait 100ms for quick failures
-                stdout_data = process.readAllStandardOutput().data().decode('utf-8', errors='replace')
-                stderr_data = process.readAllStandardError().data().decode('utf-8', errors='replace')
-                exit_code = process.exitCode()
-                
-                if stdout_data:
-                    self.signals.debug_received.emit(self._current_stage, f"QUICK_STDOUT: {repr(stdout_data)}")
-                if stderr_data:
-                    self.signals.debug_received.emit(self._current_stage, f"QUICK_STDERR: {repr(stderr_data)}")
-                if exit_code != 0:
-                    self.signals.debug_received.emit(self._current_stage, f"QUICK_EXIT_CODE: {exit_code}")
+        # Startup, early output and quick failures are picked up by the
+        # started/readyRead/errorOccurred handlers
+        if self._debug_enabled and self._current_stage:
+            self.signals.debug_received.emit(self._current_stage, f"Process start requested, waiting for started signal...")
         
         return process
     
     def _on_process_started(self):
         """Handle process started signal."""
         if self._current_stage:
-            self._logger.info(f"Process started for stage: {self._current_stage.value}")
+            self._logger.info("Process started for stage: %s", self._current_stage.value)
             
             # Get process ID for debugging
             if self._current_process:
-                process_id = self._current_process.processId()
-                self.signals.debug_received.emit(self._current_stage, f"Process started with PID: {process_id}")
-                self.signals.debug_received.emit(self._current_stage, f"Process state: {self._current_process.state()}")
-                
-                # Set up periodic output checking for early crash detection
-                self._setup_output_monitoring()
+                if self._debug_enabled:
+                    process_id = self._current_process.processId()
+                    self.signals.debug_received.emit(
+                        self._current_stage,
+                        f"Process started with PID: {process_id}\nProcess state: {self._current_process.state()}"
+                    )
             
             self.signals.process_started.emit(self._current_stage)
     
-    def _setup_output_monitoring(self):
-        """Set up periodic monitoring for process output."""
-        if hasattr(self, '_output_monitor_timer'):
-            self._output_monitor_timer.stop()
-            
-        self._output_monitor_timer = QTimer(self)
-        self._output_monitor_timer.timeout.connect(self._check_process_output)
-        # Increase frequency to prevent buffer overflow
-        self._output_monitor_timer.start(50)  # Check every 50ms
+    def _reset_output_buffers(self):
+        """Clear the stdout byte buffer and decoder state."""
+        self._stdout_bytes_buf.clear()
+        self._stdout_decoder.reset()
+        self._stderr_decoder.reset()
     
     def _on_process_about_to_close(self):
         """Handle process about to close signal - final chance to read output."""
         if not self._current_process or not self._current_stage or self._final_output_read:
             return
         
-        self.signals.debug_received.emit(self._current_stage, "Process about to close - reading final output")
-        
-        # Stop monitoring immediately
-        if hasattr(self, '_output_monitor_timer'):
-            self._output_monitor_timer.stop()
+        if self._debug_enabled:
+            self.signals.debug_received.emit(self._current_stage, "Process about to close - reading final output")
         
         # Read final output now
         self._read_final_output()
     
-    def _check_process_output(self):
-        """Periodically check for process output."""
-        if not self._current_process or self._current_process.state() != QProcess.Running:
-            if hasattr(self, '_output_monitor_timer'):
-                self._output_monitor_timer.stop()
-            return
-        
-        # Skip if process is completing to avoid race conditions
-        if self._process_completing:
+    def _schedule_stdout_drain(self):
+        """Coalesce readyReadStandardOutput bursts into one drain per tick."""
+        if not self._stdout_coalesce_timer.isActive():
+            self._stdout_coalesce_timer.start()
+    
+    def _on_stdout_ready(self):
+        """Drain stdout data from process."""
+        # A direct drain covers anything a pending coalesced drain would read
+        self._stdout_coalesce_timer.stop()
+        if not self._current_process or self._in_stdout_ready:
             return
         
+        self._in_stdout_ready = True
         try:
-            # Force check for available output
-            if self._current_process.bytesAvailable() > 0:
-                self._on_stdout_ready()
-                
-            # Check stderr too
-            stderr_data = self._current_process.readAllStandardError()
-            if stderr_data and stderr_data.size() > 0:
-                self._on_stderr_ready()
-                
-        except Exception as e:
-            # Handle any reading errors gracefully
-            if self._current_stage:
-                self.signals.debug_received.emit(self._current_stage, f"OUTPUT_CHECK_ERROR: {str(e)}")
+            self._read_stdout()
+        finally:
+            self._in_stdout_ready = False
     
-    def _on_stdout_ready(self):
-        """Handle stdout data from process."""
-        if not self._current_process:
-            return
+    def _read_stdout(self):
+        """Drain stdout and feed complete lines to the JSONL parser."""
+        process = self._current_process
+        buf = self._stdout_bytes_buf
         
         try:
-            # Read ALL available data immediately to prevent pipe buffer overflow
-            raw_data = self._current_process.readAllStandardOutput()
-            if raw_data.size() == 0:
-                return
-                
-            data = raw_data.data().decode('utf-8', errors='replace')
+            # Drain ALL available data immediately to prevent pipe buffer overflow
+            while True:
+                raw_data = process.readAllStandardOutput()
+                if raw_data.size() == 0:
+                    break
+                # QByteArray exposes the buffer protocol, so append without a bytes() copy
+                buf += raw_data
+                if process.bytesAvailable() <= 0:
+                    break
             
-            # If there's still more data available, schedule another read
-            if self._current_process.bytesAvailable() > 0:
-                # Use a timer to schedule immediate re-reading
-                QTimer.singleShot(0, self._on_stdout_ready)
+            if not buf:
+                return
+            data = bytes(buf)
         
         except Exception as e:
             # Handle broken pipe or closed process gracefully
             if self._current_stage:
                 self.signals.debug_received.emit(self._current_stage, f"STDOUT_READ_ERROR: {str(e)}")
             return
+        finally:
+            buf.clear()
+        
+        # Decode to text only for listeners that want it
+        send_output = self.signals.has_output_receivers
+        send_debug = self._debug_enabled and self._current_stage is not None
+        if send_output or send_debug:
+            text = self._stdout_decoder.decode(data)
+            if text:
+                # Emit raw output signal (skipped when nothing is connected)
+                if send_output:
+                    self.signals.process_output_received.emit(text)
+                
+                # Mirror the chunk to the debug log as a single message
+                if send_debug:
+                    self.signals.debug_received.emit(self._current_stage, f"RAW_STDOUT: {_truncated_text(text)}")
+        
+        # Keep a bounded raw tail for get_output_tail(); whole chunks are
+        # dropped from the front once the limit is exceeded
+        tail = self._output_tail
+        tail.append(data)
+        self._output_tail_size += len(data)
+        while self._output_tail_size - len(tail[0]) >= _OUTPUT_TAIL_LIMIT:
+            self._output_tail_size -= len(tail.popleft())
+        
+        # Parse JSONL events on the parser thread, straight from the bytes;
+        # the parser holds back any partial line until its newline arrives
+        self._parse_requested.emit(self._parse_generation, data)
+    
+    def _on_events_parsed(self, generation: int, data: str, results: list):
+        """Dispatch events parsed by the worker."""
+        if generation != self._parse_generation:
+            return
         
-        # Emit raw output signal
-        self.signals.process_output_received.emit(data)
-        
-        # Send ALL stdout to debug log immediately - don't filter anything
-        if self._current_stage and data:
-            # Log the raw data first
-            self.signals.debug_received.emit(self._current_stage, f"RAW_STDOUT: {repr(data)}")
-            
-            # Then split by lines for readability
-            lines = data.split('\n')
-            for i, line in enumerate(lines):
-                # Include empty lines to preserve structure
-                self.signals.debug_received.emit(self._current_stage, f"STDOUT[{i}]: {repr(line)}")
+        events: List[Event] = []
+        for event, error in results:
+            if event:
+                events.append(event)
+            elif error:
+                self.signals.parse_error.emit(data, error)
+                # Also send parse errors to debug log
+                if self._current_stage:
+                    self.signals.debug_received.emit(self._current_stage, f"PARSE ERROR: {error}")
+        
+        if events:
+            self._handle_events(events)
+    
+    def _on_parse_failed(self, generation: int, data: str, error: str):
+        """Report an unexpected failure while parsing a stdout chunk."""
+        if generation != self._parse_generation:
+            return
         
-        # Parse JSONL events
-        try:
-            for event, error in self._parser.parse_stream_data(data):
-                if event:
-                    self._handle_event(event)
-                elif error:
-                    self.signals.parse_error.emit(data, error)
-                    # Also send parse errors to debug log
-                    if self._current_stage:
-                        self.signals.debug_received.emit(self._current_stage, f"PARSE ERROR: {error}")
-                    
-        except Exception as e:
-            self._logger.error(f"Error processing stdout: {e}")
-            self.signals.parse_error.emit(data, str(e))
-            if self._current_stage:
-                self.signals.debug_received.emit(self._current_stage, f"PROCESSING ERROR: {str(e)}")
+        self._logger.error("Error processing stdout: %s", error)
+        self.signals.parse_error.emit(data, error)
+        if self._current_stage:
+            self.signals.debug_received.emit(self._current_stage, f"PROCESSING ERROR: {error}")
     
     def _on_stderr_ready(self):
         """Handle stderr data from process."""
-        if not self._current_process:
+        if not self._current_process or self._in_stderr_ready:
             return
         
+        self._in_stderr_ready = True
+        try:
+            self._read_stderr()
+        finally:
+            self._in_stderr_ready = False
+    
+    def _read_stderr(self):
+        """Drain stderr and forward it to the UI and log."""
         try:
             raw_data = self._current_process.readAllStandardError()
             if raw_data.size() == 0:
                 return
-                
-            data = raw_data.data().decode('utf-8', errors='replace')
         except Exception as e:
             # Handle broken pipe or closed process gracefully
             if self._current_stage:
                 self.signals.debug_received.emit(self._current_stage, f"STDERR_READ_ERROR: {str(e)}")
             return
         
+        send_error = self.signals.has_error_receivers
+        send_debug = self._debug_enabled and self._current_stage is not None
+        if not (send_error or send_debug):
+            # Only the log may want it; decode a bounded tail rather than the whole chunk
+            if self._logger.isEnabledFor(logging.WARNING):
+                size = raw_data.size()
+                tail = bytes(raw_data[max(0, size - _DEBUG_TEXT_LIMIT):]).decode('utf-8', errors='replace')
+                if size > _DEBUG_TEXT_LIMIT:
+                    tail = f"...(+{size - _DEBUG_TEXT_LIMIT} bytes){tail}"
+                self._logger.warning("Process stderr: %s", tail)
+            return
+        
+        data = self._stderr_decoder.decode(raw_data)
+        
         # Emit stderr signal
-        self.signals.process_error_received.emit(data)
+        if send_error:
+            self.signals.process_error_received.emit(data)
         
-        # Send ALL stderr to UI for debugging - don't filter anything
-        if self._current_stage and data:
-            # Log the raw data first
-            self.signals.debug_received.emit(self._current_stage, f"RAW_STDERR: {repr(data)}")
-            
-            # Then split by lines for readability
-            lines = data.split('\n')
-            for i, line in enumerate(lines):
-                # Include empty lines to preserve structure
-                self.signals.debug_received.emit(self._current_stage, f"STDERR[{i}]: {repr(line)}")
+        # Mirror the chunk to the debug log as a single message
+        if send_debug and data:
+            self.signals.debug_received.emit(self._current_stage, f"RAW_STDERR: {_truncated_text(data)}")
         
         # Log stderr data
-        self._logger.warning(f"Process stderr: {data}")
+        self._logger.warning("Process stderr: %s", data)
     
     def _on_process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus):
         """Handle process finished signal."""
         if not self._current_stage:
             return
             
-        if self._completion_handled:
-            self.signals.debug_received.emit(self._current_stage, f"Process finished signal received but completion already handled - ignoring (exit_code: {exit_code}, status: {exit_status})")
+        # Mark completion as handled; bail out if finish/error already did
+        if self._completion_flag.test_and_set():
+            if self._debug_enabled:
+                self.signals.debug_received.emit(self._current_stage, f"Process finished signal received but completion already handled - ignoring (exit_code: {exit_code}, status: {exit_status})")
             return
         
-        # Mark completion as handled to prevent duplicate processing
-        self._completion_handled = True
-        self._process_completing = True
-        
-        self.signals.debug_received.emit(self._current_stage, f"Process finished signal received - exit_code: {exit_code}, status: {exit_status} [HANDLING]")
-        
-        # Stop output monitoring immediately to prevent race conditions
-        if hasattr(self, '_output_monitor_timer'):
-            self._output_monitor_timer.stop()
+        if self._debug_enabled:
+            self.signals.debug_received.emit(self._current_stage, f"Process finished signal received - exit_code: {exit_code}, status: {exit_status} [HANDLING]")
         
         # If we haven't read final output yet, do it now
         if not self._final_output_read:
@@ -565,256 +821,288 @@ class ScriptRunner(QObject):
         self._final_output_read = True
         
         try:
-            # Give the process multiple chances to flush output
-            for attempt in range(3):
-                self._current_process.waitForReadyRead(50)
-                
-                stdout_data = self._current_process.readAllStandardOutput()
-                stderr_data = self._current_process.readAllStandardError()
-                
-                if stdout_data.size() > 0:
-                    data = stdout_data.data().decode('utf-8', errors='replace')
-                    self.signals.debug_received.emit(self._current_stage, f"FINAL_STDOUT_A{attempt}: {repr(data)}")
-                    
-                    # Process any remaining JSONL events
-                    try:
-                        for event, error in self._parser.parse_stream_data(data):
-                            if event:
-                                self._handle_event(event)
-                            elif error:
-                                self.signals.parse_error.emit(data, error)
-                    except Exception as e:
-                        self.signals.debug_received.emit(self._current_stage, f"FINAL_PARSE_ERROR_A{attempt}: {str(e)}")
-                
-                if stderr_data.size() > 0:
-                    data = stderr_data.data().decode('utf-8', errors='replace')
-                    self.signals.debug_received.emit(self._current_stage, f"FINAL_STDERR_A{attempt}: {repr(data)}")
-                
-                # If no more data, break early
-                if stdout_data.size() == 0 and stderr_data.size() == 0:
-                    break
-                    
+            # The pipes are flushed once the process has finished, so a single
+            # wait is enough before draining both channels
+            self._current_process.waitForReadyRead(50)
         except Exception as e:
             self.signals.debug_received.emit(self._current_stage, f"FINAL_READ_ERROR: {str(e)}")
+        
+        self._drain_buffered_output()
+    
+    def _drain_buffered_output(self):
+        """Drain only the channels that still hold buffered data."""
+        process = self._current_process
+        # bytesAvailable() reports the current read channel, which is stdout
+        if process.bytesAvailable() > 0:
+            self._on_stdout_ready()
+        
+        process.setReadChannel(QProcess.StandardError)
+        try:
+            has_stderr = process.bytesAvailable() > 0
+        finally:
+            process.setReadChannel(QProcess.StandardOutput)
+        if has_stderr:
+            self._on_stderr_ready()
     
     def _complete_process_handling(self, exit_code: int, exit_status: QProcess.ExitStatus):
         """Complete the process handling after ensuring all output is read."""
-        if not self._current_stage:
+        stage = self._current_stage
+        if not stage:
             return
             
-        # Add debug to show we're in completion handling
-        self.signals.debug_received.emit(self._current_stage, f"_complete_process_handling called - exit_code: {exit_code}, status: {exit_status}")
+        debug_enabled = self._debug_enabled
         
-        if not self._completion_handled:
+        if not self._completion_flag.is_set():
             # Sanity check - this should not happen if our logic is correct
-            self.signals.debug_received.emit(self._current_stage, f"_complete_process_handling called but completion not marked as handled - this indicates a logic error")
+            if debug_enabled:
+                self.signals.debug_received.emit(stage, f"_complete_process_handling called but completion not marked as handled - this indicates a logic error")
             return
         
-        # Flush any remaining parser buffer
-        try:
-            for event, error in self._parser.flush_buffer():
-                if event:
-                    self._handle_event(event)
-                elif error:
-                    self.signals.parse_error.emit("", error)
-        except Exception as e:
-            self._logger.error(f"Error flushing parser buffer: {e}")
+        # Diagnostic lines collected during completion, emitted as one message
+        debug_lines: List[str] = []
+        add_debug = debug_lines.append
+        if debug_enabled:
+            add_debug(f"_complete_process_handling called - exit_code: {exit_code}, status: {exit_status}")
+        
+        self._flush_output(lambda: self._finish_process_handling(exit_code, exit_status, debug_lines))
+    
+    def _flush_output(self, on_flushed: Callable[[], None]):
+        """
+        Flush decoders and the parser buffer, then call ``on_flushed``.
+        
+        The worker answers after every chunk already queued to it has been
+        parsed, so ``on_flushed`` runs once all of the job's events are handled.
+        """
+        # A truncated multi-byte sequence at the very end of stdout
+        if self.signals.has_output_receivers:
+            stdout_tail = self._stdout_decoder.decode(b'', final=True)
+            if stdout_tail:
+                self.signals.process_output_received.emit(stdout_tail)
+        
+        # A truncated multi-byte sequence at the very end of stderr
+        stderr_tail = self._stderr_decoder.decode(b'', final=True)
+        if stderr_tail:
+            if self.signals.has_error_receivers:
+                self.signals.process_error_received.emit(stderr_tail)
+            self._logger.warning("Process stderr: %s", stderr_tail)
+        
+        self._after_parser_flush = on_flushed
+        self._flush_requested.emit(self._parse_generation)
+    
+    def _on_parser_flushed(self, generation: int, results: list, flush_error: str):
+        """Handle the parser's final events and continue the pending completion."""
+        if generation != self._parse_generation or self._after_parser_flush is None:
+            return
+        
+        on_flushed = self._after_parser_flush
+        self._after_parser_flush = None
+        
+        events: List[Event] = []
+        for event, error in results:
+            if event:
+                events.append(event)
+            elif error:
+                self.signals.parse_error.emit("", error)
+        if events:
+            self._handle_events(events)
+        
+        if flush_error:
+            self._logger.error("Error flushing parser buffer: %s", flush_error)
             if self._current_stage:
-                self.signals.debug_received.emit(self._current_stage, f"PARSER_FLUSH_ERROR: {str(e)}")
+                self.signals.debug_received.emit(self._current_stage, f"PARSER_FLUSH_ERROR: {flush_error}")
+        
+        on_flushed()
+    
+    def _finish_process_handling(self, exit_code: int, exit_status: QProcess.ExitStatus,
+                                 debug_lines: List[str]):
+        """Build the process result, clean up, and report completion."""
+        stage = self._current_stage
+        if not stage:
+            return
+        
+        debug_enabled = self._debug_enabled
+        add_debug = debug_lines.append
         
         # Create process result
         duration = 0.0
-        if self._process_start_time:
-            duration = (datetime.now() - self._process_start_time).total_seconds()
+        if self._process_start_time is not None:
+            duration = time.monotonic() - self._process_start_time
         
-        # Get summary from aggregator
-        summary = {}
-        if self._aggregator:
-            summary = self._aggregator.get_summary()
+        # Only the result payload is needed here; get_summary() would also
+        # build the event statistics and recompute the duration
+        aggregator = self._aggregator
+        result_data = aggregator.result_data if aggregator else None
         
         # Special handling for SIGTERM after apparent success (broken pipe issue)
         # If we have result data and exit code is 15 (SIGTERM), treat as success
         apparent_success = (exit_code == 0 and exit_status == QProcess.NormalExit)
         
         # Check for broken pipe scenario: SIGTERM but with valid outputs
-        has_outputs = (summary.get('result_data') and 
-                      summary.get('result_data', {}).get('outputs'))
-        has_successful_files = (summary.get('result_data') and 
-                              summary.get('result_data', {}).get('files_successful', 0) > 0)
+        if result_data:
+            output_files = result_data.get('outputs', [])
+            files_successful = result_data.get('files_successful', 0)
+        else:
+            output_files, files_successful = [], 0
+        has_outputs = bool(output_files)
+        has_successful_files = files_successful > 0
         
         sigterm_after_success = (exit_code == 15 and (has_outputs or has_successful_files))
         
-        if sigterm_after_success:
-            self.signals.debug_received.emit(self._current_stage, "SIGTERM detected but process produced valid outputs - broken pipe issue detected, treating as success")
-            self.signals.debug_received.emit(self._current_stage, f"SIGTERM_OVERRIDE - has_outputs: {has_outputs}, has_successful_files: {has_successful_files}")
-        elif exit_code == 15:
-            self.signals.debug_received.emit(self._current_stage, f"SIGTERM without valid outputs - summary keys: {list(summary.keys()) if summary else 'None'}")
-            if summary.get('result_data'):
-                self.signals.debug_received.emit(self._current_stage, f"SIGTERM result_data keys: {list(summary['result_data'].keys())}")
-            self.signals.debug_received.emit(self._current_stage, f"SIGTERM_DETAILS - has_outputs: {has_outputs}, has_successful_files: {has_successful_files}")
+        if debug_enabled:
+            if sigterm_after_success:
+                add_debug("SIGTERM detected but process produced valid outputs - broken pipe issue detected, treating as success")
+                add_debug(f"SIGTERM_OVERRIDE - has_outputs: {has_outputs}, has_successful_files: {has_successful_files}")
+            elif exit_code == 15:
+                add_debug(f"SIGTERM without valid outputs - result_data keys: {list(result_data.keys()) if result_data else 'None'}")
+                add_debug(f"SIGTERM_DETAILS - has_outputs: {has_outputs}, has_successful_files: {has_successful_files}")
         
         # Create result object
         result = ProcessResult(
             success=(apparent_success or sigterm_after_success),
             exit_code=exit_code,
-            stage=self._current_stage,
+            stage=stage,
             duration_seconds=duration,
-            result_data=summary.get('result_data')
+            result_data=result_data
         )
         
         # Extract file statistics from result data if available
-        if result.result_data:
-            result.files_processed = result.result_data.get('files_processed', 0)
-            result.files_successful = result.result_data.get('files_successful', 0) 
-            result.files_failed = result.result_data.get('files_failed', 0)
-            result.output_files = result.result_data.get('outputs', [])
+        if result_data:
+            result.files_processed = result_data.get('files_processed', 0)
+            result.files_successful = files_successful
+            result.files_failed = result_data.get('files_failed', 0)
+            result.output_files = output_files
         
         # Set error message if process failed
         if not result.success:
-            if self._aggregator and self._aggregator.errors:
-                result.error_message = '; '.join(self._aggregator.errors)
+            if aggregator and aggregator.errors:
+                errors = aggregator.errors
+                result.error_message = '; '.join(errors[:_MAX_REPORTED_ERRORS])
+                if len(errors) > _MAX_REPORTED_ERRORS:
+                    result.error_message += f" (+{len(errors) - _MAX_REPORTED_ERRORS} more)"
             else:
                 if exit_code == 15 and not sigterm_after_success:
                     result.error_message = f"Process terminated with SIGTERM (broken pipe or early termination)"
                 else:
                     result.error_message = f"Process exited with code {exit_code}"
         
-        # Emit result signal
-        self.signals.process_finished.emit(result)
-        
         # Log completion
         status = "successfully" if result.success else "with errors"
-        self._logger.info(f"Process completed {status} in {duration:.1f}s")
+        self._logger.info("Process completed %s in %.1fs", status, duration)
         
         # Send completion debug info to UI
-        if self._current_stage:
-            self.signals.debug_received.emit(self._current_stage, f"FINAL_RESULT - success: {result.success}, exit_code: {result.exit_code}")
+        if debug_enabled:
+            add_debug(f"FINAL_RESULT - success: {result.success}, exit_code: {result.exit_code}")
             if sigterm_after_success:
-                self.signals.debug_received.emit(self._current_stage, f"SIGTERM_OVERRIDE applied - treated as success")
-        
-        # Send debug info to UI
-        if self._current_stage:
-            self.signals.debug_received.emit(self._current_stage, f"Process completed {status} in {duration:.1f}s")
-            self.signals.debug_received.emit(self._current_stage, f"Exit code: {exit_code}, Exit status: {exit_status}")
+                add_debug(f"SIGTERM_OVERRIDE applied - treated as success")
+            add_debug(f"Process completed {status} in {duration:.1f}s")
+            add_debug(f"Exit code: {exit_code}, Exit status: {exit_status}")
             
             if result.output_files:
-                self.signals.debug_received.emit(self._current_stage, f"Output files: {result.output_files}")
+                add_debug(f"Output files: {result.output_files}")
             else:
-                self.signals.debug_received.emit(self._current_stage, f"No output files found in result")
+                add_debug(f"No output files found in result")
             
             # Always show file processing stats, even if zero
-            files_processed = getattr(result, 'files_processed', 0)
-            files_successful = getattr(result, 'files_successful', 0)  
-            files_failed = getattr(result, 'files_failed', 0)
-            self.signals.debug_received.emit(self._current_stage, f"Files processed: {files_processed}, Successful: {files_successful}, Failed: {files_failed}")
+            add_debug(f"Files processed: {result.files_processed}, Successful: {result.files_successful}, Failed: {result.files_failed}")
             
             # Show result data structure for debugging
             if result.result_data:
-                self.signals.debug_received.emit(self._current_stage, f"Result data keys: {list(result.result_data.keys())}")
+                add_debug(f"Result data keys: {list(result.result_data.keys())}")
             else:
-                self.signals.debug_received.emit(self._current_stage, f"No result data available")
+                add_debug(f"No result data available")
                 
             # Show success determination logic
-            self.signals.debug_received.emit(self._current_stage, f"Success determination - apparent_success: {apparent_success}, sigterm_after_success: {sigterm_after_success}")
-            self.signals.debug_received.emit(self._current_stage, f"Final result.success: {result.success}")
+            add_debug(f"Success determination - apparent_success: {apparent_success}, sigterm_after_success: {sigterm_after_success}")
+            add_debug(f"Final result.success: {result.success}")
             
             # Show completion handling status
-            self.signals.debug_received.emit(self._current_stage, f"Completion handling finished - about to cleanup and emit process_finished signal")
+            add_debug(f"Completion handling finished - about to cleanup and emit process_finished signal")
+            self._emit_debug_batch(stage, debug_lines)
 
+        # Deliver the final progress value before the stage is reported finished
+        self._flush_pending_progress()
+        
         # Clean up process state FIRST to ensure is_running returns False
         # for any subsequent stage checks triggered by the process_finished signal
         self._cleanup_process()
 
-        # Now emit result signal - at this point is_running will return False
-        # allowing the next stage to start if needed
+        # Now emit result signal exactly once - at this point is_running will
+        # return False, allowing the next stage to start if needed
         self.signals.process_finished.emit(result)
     
     def _on_process_error(self, error: QProcess.ProcessError):
         """Handle process error signal."""
+        stage = self._current_stage
+        process = self._current_process
+        
         # If completion was already handled, ignore this error signal
         # This prevents the SIGTERM-after-success issue
-        if self._completion_handled:
-            if self._current_stage:
-                exit_code = self._current_process.exitCode() if self._current_process else "N/A"
-                self.signals.debug_received.emit(self._current_stage, f"Ignoring error signal - completion already handled (error: {error}, exit_code: {exit_code}) [RACE CONDITION PREVENTED]")
+        if self._completion_flag.test_and_set():
+            if self._debug_enabled and stage:
+                exit_code = process.exitCode() if process else "N/A"
+                self.signals.debug_received.emit(stage, f"Ignoring error signal - completion already handled (error: {error}, exit_code: {exit_code}) [RACE CONDITION PREVENTED]")
             return
         
-        # Mark completion as handled to prevent duplicate processing
-        self._completion_handled = True
-        
-        # Stop output monitoring immediately
-        if hasattr(self, '_output_monitor_timer'):
-            self._output_monitor_timer.stop()
-            
-        error_messages = {
-            QProcess.FailedToStart: "Failed to start process",
-            QProcess.Crashed: "Process crashed",
-            QProcess.Timedout: "Process timed out", 
-            QProcess.WriteError: "Write error",
-            QProcess.ReadError: "Read error",
-            QProcess.UnknownError: "Unknown error"
-        }
-        
-        error_msg = error_messages.get(error, f"Process error: {error}")
+        error_msg = _PROCESS_ERROR_MESSAGES.get(error, f"Process error: {error}")
         self._logger.error(error_msg)
         
-        if self._current_stage:
-            # Send detailed error information to debug log
-            self.signals.debug_received.emit(self._current_stage, f"PROCESS ERROR: {error_msg}")
+        if stage:
+            # Send detailed error information to debug log as one message
+            debug_lines: List[str] = []
+            add_debug = debug_lines.append
+            if self._debug_enabled:
+                add_debug(f"PROCESS ERROR: {error_msg}")
             
             # Get more crash details
-            if self._current_process:
-                # Try to read any final output before the process dies
-                try:
-                    final_stdout = self._current_process.readAllStandardOutput().data().decode('utf-8', errors='replace')
-                    final_stderr = self._current_process.readAllStandardError().data().decode('utf-8', errors='replace')
-                    
-                    if final_stdout:
-                        self.signals.debug_received.emit(self._current_stage, f"CRASH_FINAL_STDOUT: {repr(final_stdout)}")
-                    if final_stderr:
-                        self.signals.debug_received.emit(self._current_stage, f"CRASH_FINAL_STDERR: {repr(final_stderr)}")
-                    
-                    # If no stderr captured, this might be the issue
-                    if not final_stderr:
-                        self.signals.debug_received.emit(self._current_stage, f"NO STDERR CAPTURED - This might be the root cause!")
-                        
-                except Exception as e:
-                    self.signals.debug_received.emit(self._current_stage, f"Error reading final output: {e}")
-                
+            if self._debug_enabled and process:
                 # Get comprehensive process information
-                exit_code = self._current_process.exitCode()
-                exit_status = self._current_process.exitStatus()
-                process_state = self._current_process.state()
+                exit_code = process.exitCode()
+                exit_status = process.exitStatus()
+                process_state = process.state()
                 
-                self.signals.debug_received.emit(self._current_stage, f"Process exit code: {exit_code}")
-                self.signals.debug_received.emit(self._current_stage, f"Process exit status: {exit_status}")
-                self.signals.debug_received.emit(self._current_stage, f"Process state: {process_state}")
+                add_debug(f"Process exit code: {exit_code}")
+                add_debug(f"Process exit status: {exit_status}")
+                add_debug(f"Process state: {process_state}")
                 
                 # Interpret exit codes for better debugging
-                if exit_code == 15:
-                    self.signals.debug_received.emit(self._current_stage, f"EXIT CODE 15 = SIGTERM - Process was terminated")
-                elif exit_code == 9:
-                    self.signals.debug_received.emit(self._current_stage, f"EXIT CODE 9 = SIGKILL - Process was forcibly killed")
-                elif exit_code == 139:
-                    self.signals.debug_received.emit(self._current_stage, f"EXIT CODE 139 = SIGSEGV - Segmentation fault")
-                elif exit_code == 2:
-                    self.signals.debug_received.emit(self._current_stage, f"EXIT CODE 2 = File not found or permission denied")
-                elif exit_code == 1:
-                    self.signals.debug_received.emit(self._current_stage, f"EXIT CODE 1 = General error")
+                exit_description = _EXIT_CODE_DESCRIPTIONS.get(exit_code)
+                if exit_description:
+                    add_debug(f"EXIT CODE {exit_code} = {exit_description}")
                 elif exit_code != 0:
-                    self.signals.debug_received.emit(self._current_stage, f"Non-zero exit code indicates error")
+                    add_debug(f"Non-zero exit code indicates error")
                     
                 # Try to get system error information
-                error_string = self._current_process.errorString()
+                error_string = process.errorString()
                 if error_string:
-                    self.signals.debug_received.emit(self._current_stage, f"System error string: {error_string}")
+                    add_debug(f"System error string: {error_string}")
             
-            # Clean up first, then emit signal to ensure is_running returns False
-            current_stage_for_signal = self._current_stage
-            self._cleanup_process()
+            if debug_lines:
+                self._emit_debug_batch(stage, debug_lines)
             
-            # Emit signal after cleanup
-            self.signals.process_failed.emit(current_stage_for_signal, error_msg)
+            if process is None or error == QProcess.FailedToStart:
+                # Nothing was ever written, so there is no output to wait for
+                self._report_process_failure(stage, error_msg)
+                return
+            
+            # Drain what the process wrote before dying through the normal
+            # handlers so its events reach the parser, then report the failure
+            self._on_stdout_ready()
+            self._on_stderr_ready()
+            self._flush_output(lambda: self._report_process_failure(stage, error_msg))
+    
+    def _report_process_failure(self, stage: Stage, error_msg: str):
+        """Clean up after a process error and emit process_failed."""
+        # Clean up first, then emit signal to ensure is_running returns False
+        self._flush_pending_progress()
+        self._cleanup_process()
+        
+        # Emit signal after cleanup
+        self.signals.process_failed.emit(stage, error_msg)
+    
+    def _emit_debug_batch(self, stage: Stage, lines: List[str]):
+        """Emit several diagnostic lines as a single debug message."""
+        if lines:
+            self.signals.debug_received.emit(stage, "\n".join(lines))
     
     def _handle_event(self, event: Event):
         """
@@ -826,26 +1114,82 @@ class ScriptRunner(QObject):
         # Add to aggregator
         if self._aggregator:
             self._aggregator.add_event(event)
+            self._cached_progress_info = None
         
-        # Emit appropriate signals
-        self.signals.event_received.emit(event)
+        self._dispatch_event(event)
+    
+    def _handle_events(self, events: List[Event]):
+        """
+        Handle all events parsed from one stdout chunk.
         
-        if event.event_type == EventType.INFO:
-            self.signals.info_received.emit(event.stage, event.message)
-            
-        elif event.event_type == EventType.PROGRESS:
-            progress = event.progress if event.progress is not None else 0
-            self.signals.progress_updated.emit(event.stage, progress, event.message)
-            
-        elif event.event_type == EventType.WARNING:
-            self.signals.warning_received.emit(event.stage, event.message)
-            
-        elif event.event_type == EventType.ERROR:
-            self.signals.error_received.emit(event.stage, event.message)
-            
-        elif event.event_type == EventType.RESULT:
-            data = event.data if event.data is not None else {}
-            self.signals.result_received.emit(event.stage, data)
+        The aggregator is updated once for the whole batch before the
+        per-event signals go out.
+        
+        Args:
+            events: Parsed event objects, in stream order
+        """
+        if self._aggregator:
+            self._aggregator.add_events(events)
+            self._cached_progress_info = None
+        
+        for event in events:
+            self._dispatch_event(event)
+        
+        # One signal per chunk for consumers that process events in bulk
+        if self.signals.has_batch_receivers:
+            self.signals.events_batch_received.emit(events)
+    
+    def _dispatch_event(self, event: Event):
+        """Emit the signals for a single event."""
+        # Emit appropriate signals; the raw event signal only when connected
+        if self.signals.has_event_receivers:
+            self.signals.event_received.emit(event)
+        
+        handler = self._event_dispatch.get(event.event_type)
+        if handler:
+            handler(event)
+    
+    def _emit_info(self, event: Event):
+        self.signals.info_received.emit(event.stage, event.message)
+    
+    def _emit_progress(self, event: Event):
+        progress = event.progress if event.progress is not None else 0
+        update = (event.stage, progress, event.message)
+        
+        # Throttle: emit the first update of a window immediately and keep only
+        # the latest one until the window closes
+        if self._progress_flush_timer.isActive():
+            self._pending_progress = update
+            return
+        self.signals.progress_updated.emit(*update)
+        self._progress_flush_timer.start(_PROGRESS_THROTTLE_MS)
+    
+    def _flush_progress(self):
+        """Emit the latest coalesced progress update, if any."""
+        update = self._pending_progress
+        if update is None:
+            return
+        self._pending_progress = None
+        self.signals.progress_updated.emit(*update)
+        self._progress_flush_timer.start(_PROGRESS_THROTTLE_MS)
+    
+    def _flush_pending_progress(self):
+        """Force out a held-back progress update, e.g. before completion."""
+        self._progress_flush_timer.stop()
+        update = self._pending_progress
+        self._pending_progress = None
+        if update is not None:
+            self.signals.progress_updated.emit(*update)
+    
+    def _emit_warning(self, event: Event):
+        self.signals.warning_received.emit(event.stage, event.message)
+    
+    def _emit_error(self, event: Event):
+        self.signals.error_received.emit(event.stage, event.message)
+    
+    def _emit_result(self, event: Event):
+        data = event.data if event.data is not None else {}
+        self.signals.result_received.emit(event.stage, data)
     
     def terminate_process(self, timeout: int = 5) -> bool:
         """
@@ -860,7 +1204,7 @@ class ScriptRunner(QObject):
         if not self.is_running:
             return True
         
-        self._logger.info(f"Terminating process for stage: {self._current_stage}")
+        self._logger.info("Terminating process for stage: %s", self._current_stage)
         
         # Add debug info - this helps track if we're terminating the process ourselves
         if self._current_stage:
@@ -910,63 +1254,116 @@ class ScriptRunner(QObject):
     def _cleanup_process(self):
         """Clean up process-related state."""
         current_stage = self._current_stage  # Save for logging before clearing
+        process = self._current_process
+        debug_enabled = self._debug_enabled
+        debug_lines: List[str] = []
         
         self._termination_timer.stop()
+        self._progress_flush_timer.stop()
+        self._stdout_coalesce_timer.stop()
+        self._pending_progress = None
         
-        # Stop output monitoring
-        if hasattr(self, '_output_monitor_timer'):
-            self._output_monitor_timer.stop()
-        
-        if self._current_process:
-            try:
-                # Disconnect all signals first to prevent further signal processing
-                self._current_process.readyReadStandardOutput.disconnect()
-                self._current_process.readyReadStandardError.disconnect()
-                self._current_process.finished.disconnect()
-                self._current_process.errorOccurred.disconnect()
-                self._current_process.started.disconnect()
-                if hasattr(self._current_process, 'aboutToClose'):
-                    self._current_process.aboutToClose.disconnect()
-            except Exception as e:
-                # Signal disconnection might fail if already disconnected
-                if current_stage:
-                    self.signals.debug_received.emit(current_stage, f"Signal disconnection error (expected): {e}")
+        # Clear reference IMMEDIATELY to make is_running return False
+        self._current_process = None
+        
+        if process:
+            # Silence the process instead of disconnecting it; its handlers stay
+            # wired for reuse and are unblocked when it is next acquired
+            process.blockSignals(True)
             
             # Skip final output reading in cleanup since it was already done in _read_final_output
             # This prevents any race conditions or additional delays
             
-            # Ensure process is properly terminated before cleanup
-            if self._current_process.state() == QProcess.Running:
-                if current_stage:
-                    self.signals.debug_received.emit(current_stage, f"Process still running during cleanup - terminating")
-                self._current_process.terminate()
-                if not self._current_process.waitForFinished(1000):  # Reduced timeout for cleanup
-                    self._current_process.kill()
-                    self._current_process.waitForFinished(500)  # Shorter timeout for kill during cleanup
-            
-            # Safely delete the process
-            process = self._current_process
-            self._current_process = None  # Clear reference IMMEDIATELY to make is_running return False
-            if process:
-                process.deleteLater()
-        else:
-            # Ensure we clear the current_process reference even if it was None
-            self._current_process = None
+            # A finished process (the common case) goes straight back to the pool;
+            # one still running is terminated and reaped later without blocking
+            if process.state() != QProcess.NotRunning:
+                if debug_enabled:
+                    debug_lines.append(f"Process still running during cleanup - terminating")
+                process.terminate()
+                QTimer.singleShot(_CLEANUP_KILL_DELAY_MS, functools.partial(self._reap_process, process))
+            else:
+                self._release_process(process)
         
-        # Reset state flags AFTER clearing process reference
-        self._process_completing = False
+        # Reset state flags AFTER clearing process reference; results still
+        # queued on the parser thread belong to the old generation and are dropped
+        self._parse_generation += 1
+        self._after_parser_flush = None
+        self._reset_output_buffers()
         self._final_output_read = False
-        self._completion_handled = False
+        self._completion_flag.clear()
         
         # Clear stage and config references
         self._current_stage = None
         self._current_config = None
         self._aggregator = None
+        self._cached_progress_info = None
         self._process_start_time = None
         
         # Add debug message to confirm cleanup completed
-        if current_stage:
-            self.signals.debug_received.emit(current_stage, f"Process cleanup completed - is_running should now return False")
+        if debug_enabled and current_stage:
+            debug_lines.append(f"Process cleanup completed - is_running should now return False")
+            self._emit_debug_batch(current_stage, debug_lines)
+    
+    def _acquire_process(self) -> QProcess:
+        """Take an idle QProcess from the pool, or create and wire a new one."""
+        if self._process_pool:
+            process = self._process_pool.pop()
+            process.blockSignals(False)
+            return process
+        
+        # Signals are connected once for the lifetime of the process object
+        process = QProcess(self)
+        process.readyReadStandardOutput.connect(self._schedule_stdout_drain)
+        process.readyReadStandardError.connect(self._on_stderr_ready)
+        process.finished.connect(self._on_process_finished)
+        process.errorOccurred.connect(self._on_process_error)
+        process.started.connect(self._on_process_started)
+        
+        # Connect aboutToClose signal to handle graceful shutdown
+        process.aboutToClose.connect(self._on_process_about_to_close)
+        return process
+    
+    def _reap_process(self, process: QProcess):
+        """Kill a process that ignored terminate() during cleanup and delete it."""
+        try:
+            if process.state() != QProcess.NotRunning:
+                process.kill()
+            process.deleteLater()
+        except RuntimeError:
+            # Already deleted together with its parent runner
+            pass
+    
+    def _release_process(self, process: QProcess):
+        """
+        Return a silenced, finished QProcess to the pool.
+        
+        Processes that are still running or do not fit in the pool are
+        deleted instead.
+        """
+        if process.state() != QProcess.NotRunning or len(self._process_pool) >= _PROCESS_POOL_SIZE:
+            process.deleteLater()
+            return
+        
+        # Drop unread output and channel state so the next start() begins clean
+        process.close()
+        self._process_pool.append(process)
+    
+    def get_output_tail(self, max_bytes: int = _OUTPUT_TAIL_LIMIT) -> str:
+        """
+        Get the most recent stdout of the current or last process as text.
+        
+        Output is kept as raw bytes and only decoded here, so panels that
+        show the log can fetch it on demand instead of listening to every
+        process_output_received chunk.
+        
+        Args:
+            max_bytes: Maximum number of trailing bytes to decode
+            
+        Returns:
+            str: Decoded tail of stdout (may start mid-line)
+        """
+        data = b''.join(self._output_tail)
+        return data[-max_bytes:].decode('utf-8', errors='replace')
     
     def get_process_info(self) -> Dict[str, Any]:
         """Get information about the current process."""
@@ -979,19 +1376,21 @@ class ScriptRunner(QObject):
             }
         
         duration = 0.0
-        if self._process_start_time:
-            duration = (datetime.now() - self._process_start_time).total_seconds()
+        if self._process_start_time is not None:
+            duration = time.monotonic() - self._process_start_time
         
         progress_info = {}
         if self._aggregator:
-            progress_info = self._aggregator.get_progress_info()
+            if self._cached_progress_info is None:
+                self._cached_progress_info = self._aggregator.get_progress_info()
+            progress_info = self._cached_progress_info
         
         return {
             'running': True,
             'stage': self._current_stage.value if self._current_stage else None,
             'duration': duration,
             'progress': progress_info,
-            'parser_stats': self._parser.get_stats()
+            'parser_stats': self._parser_worker.get_stats()
         }
     
     def cancel_current_process(self):
@@ -5,10 +5,16 @@ Provides comprehensive tool detection, version validation, and installation
 guidance with cross-platform support and robust error handling.
 """
 
+import json
+import os
 import subprocess
 import shutil
 import re
+import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
@@ -17,6 +23,82 @@ from .tool_status import ToolStatus, ToolInfo, ToolRequirement, TOOL_REQUIREMENT
 from .platform_utils import PlatformUtils
 
 
+# Tool-specific version extraction patterns, tried in order on each output line
+_VERSION_PATTERNS: Dict[str, List[re.Pattern]] = {
+    "ffmpeg": [
+        re.compile(r"ffmpeg version (\S+)", re.IGNORECASE),
+        re.compile(r"version (\d+\.\d+(?:\.\d+)?)", re.IGNORECASE),
+    ],
+    "ffprobe": [
+        re.compile(r"ffprobe version (\S+)", re.IGNORECASE),
+        re.compile(r"version (\d+\.\d+(?:\.\d+)?)", re.IGNORECASE),
+    ],
+    "mkvextract": [
+        re.compile(r"mkvextract v(\d+\.\d+\.\d+)", re.IGNORECASE),
+        re.compile(r"v(\d+\.\d+\.\d+)", re.IGNORECASE),
+        re.compile(r"(\d+\.\d+\.\d+)"),
+    ],
+}
+
+# Any version-like number, for tools without specific patterns and as a fallback
+_ANY_VERSION_PATTERN = re.compile(r"(\d+\.\d+(?:\.\d+)?(?:\.\d+)?)")
+_DEFAULT_VERSION_PATTERNS = [_ANY_VERSION_PATTERN]
+
+# Everything except digits and dots, stripped from version strings
+_NON_VERSION_CHARS = re.compile(r'[^\d\.]')
+
+# Path fragments identifying an installation method, checked in order per platform
+_INSTALLATION_MARKERS: Dict[str, Tuple[Tuple[Tuple[str, ...], str], ...]] = {
+    "windows": (
+        (("chocolatey",), "chocolatey"),
+        (("scoop",), "scoop"),
+        (("program files",), "installer"),
+    ),
+    "macos": (
+        (("/opt/homebrew", "/usr/local"), "homebrew"),
+        (("/opt/local",), "macports"),
+        ((".app/contents/macos",), "app_bundle"),
+    ),
+    "linux": (  # Also used for other Unix-like platforms
+        (("/snap/",), "snap"),
+        (("flatpak",), "flatpak"),
+        ((".appimage",), "appimage"),
+        (("/usr/bin", "/usr/local/bin"), "package_manager"),
+    ),
+}
+
+# Keeps version probes from flashing a console window on Windows; 0 elsewhere
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Longest a caller waits for another thread's detection of the same tool
+_INFLIGHT_WAIT_SECONDS = 30
+
+
+def _same_detection(first: ToolInfo, second: ToolInfo) -> bool:
+    """Check whether two detection results differ only in when they were made."""
+    first_dict, second_dict = first.to_dict(), second.to_dict()
+    del first_dict["detected_at"], second_dict["detected_at"]
+    return first_dict == second_dict
+
+
+@lru_cache(maxsize=64)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """
+    Normalize a version string to a tuple of integers for comparison.
+    
+    Trailing zeros are dropped so that "6.0" and "6.0.0" compare equal with a
+    plain tuple comparison.
+    """
+    if version.lower() == "unknown":
+        return ()
+    
+    # Remove non-numeric characters except dots; empty parts count as 0
+    parts = [int(part) if part else 0 for part in _NON_VERSION_CHARS.sub('', version).split('.')]
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
 class DependencyChecker:
     """
     Enhanced dependency checker with comprehensive tool detection and validation.
@@ -30,16 +112,32 @@ class DependencyChecker:
     - Security validation for user-provided paths
     """
     
-    def __init__(self, cache_ttl_minutes: int = 10):
+    def __init__(self, cache_ttl_minutes: int = 10, cache_file: Optional[Path] = None):
         """
         Initialize dependency checker.
         
         Args:
             cache_ttl_minutes: Cache time-to-live in minutes
+            cache_file: Optional JSON file that keeps detection results across
+                restarts; results in it still expire after cache_ttl_minutes
         """
         self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
         self._cache: Dict[str, ToolInfo] = {}
         self._detection_lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        
+        # PATH lookups made by detect_all_tools, consumed by each detection
+        self._path_hints: Dict[str, List[str]] = {}
+        
+        # Last validation per (path, tool), keyed by the file's (mtime_ns, size)
+        self._validated_paths: Dict[Tuple[str, str], Tuple[Tuple[int, int], ToolInfo]] = {}
+        
+        # Results as last written to cache_file
+        self._cache_file = Path(cache_file) if cache_file else None
+        self._cache_file_lock = threading.Lock()
+        self._persisted: Dict[str, ToolInfo] = {}
+        if self._cache_file:
+            self._load_cache_file()
     
     def detect_ffmpeg(self, use_cache: bool = True) -> ToolInfo:
         """Detect ffmpeg installation with comprehensive validation."""
@@ -68,24 +166,42 @@ class DependencyChecker:
         Returns:
             Dictionary mapping tool names to ToolInfo objects
         """
-        tools = ["ffmpeg", "ffprobe", "mkvextract"]
-        results = {}
+        detectors = {
+            "ffmpeg": self.detect_ffmpeg,
+            "ffprobe": self.detect_ffprobe,
+            "mkvextract": self.detect_mkvextract,
+        }
+        found: Dict[str, ToolInfo] = {}
         
-        for i, tool in enumerate(tools):
-            if progress_callback:
-                progress_callback(tool, int((i / len(tools)) * 100))
-            
-            if tool == "ffmpeg":
-                results[tool] = self.detect_ffmpeg(use_cache)
-            elif tool == "ffprobe":
-                results[tool] = self.detect_ffprobe(use_cache)
-            elif tool == "mkvextract":
-                results[tool] = self.detect_mkvextract(use_cache)
+        # Look all uncached tools up in a single PATH pass; each detection
+        # consumes its own entry instead of scanning PATH again
+        pending = [
+            tool for tool in detectors
+            if not use_cache or self.get_cached_result(tool) is None
+        ]
+        if pending:
+            self._path_hints.update(PlatformUtils.find_executables_batch(pending))
+        
+        try:
+            # Each detection mostly waits on tool subprocesses, so run them side by
+            # side; progress is reported from this thread as each one finishes
+            with ThreadPoolExecutor(max_workers=len(detectors)) as executor:
+                futures = {executor.submit(detect, use_cache): tool for tool, detect in detectors.items()}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    tool = futures[future]
+                    found[tool] = future.result()
+                    if progress_callback:
+                        progress_callback(tool, int((done / len(detectors)) * 100))
+        finally:
+            # Drop lookups a detection did not use (e.g. it was answered from cache)
+            for tool in pending:
+                self._path_hints.pop(tool, None)
         
         if progress_callback:
             progress_callback("complete", 100)
         
-        return results
+        # Keep the usual tool order regardless of completion order
+        return {tool: found[tool] for tool in detectors}
     
     def validate_tool_path(self, path: str, tool_name: str) -> ToolInfo:
         """
@@ -150,20 +266,77 @@ class DependencyChecker:
         """Clear the detection cache."""
         with self._detection_lock:
             self._cache.clear()
+            self._validated_paths.clear()
+        PlatformUtils.clear_directory_cache()
     
     def get_cached_result(self, tool_name: str) -> Optional[ToolInfo]:
         """Get cached detection result if still valid."""
+        # dict.get is atomic, so the common read path takes no lock
+        cached_info = self._cache.get(tool_name)
+        if cached_info is None:
+            return None
+        if self._is_fresh(cached_info):
+            return cached_info
+        
+        # Remove expired cache entry, unless a fresh result replaced it meanwhile
         with self._detection_lock:
-            if tool_name in self._cache:
-                cached_info = self._cache[tool_name]
-                if cached_info.detected_at and \
-                   (datetime.now() - cached_info.detected_at) < self.cache_ttl:
-                    return cached_info
-                else:
-                    # Remove expired cache entry
-                    del self._cache[tool_name]
+            if self._cache.get(tool_name) is cached_info:
+                del self._cache[tool_name]
         return None
     
+    def _is_fresh(self, tool_info: ToolInfo) -> bool:
+        """Check whether a detection result is younger than the cache TTL."""
+        return bool(tool_info.detected_at) and \
+            (datetime.now() - tool_info.detected_at) < self.cache_ttl
+    
+    def _load_cache_file(self) -> None:
+        """Seed the cache with still-fresh results saved by a previous run."""
+        try:
+            with open(self._cache_file, 'rb') as f:
+                cache_data = json.loads(f.read())
+            results = {
+                tool: ToolInfo.from_dict(info_dict)
+                for tool, info_dict in cache_data["results"].items()
+            }
+        except Exception:
+            # Missing or unreadable cache file; detect from scratch
+            return
+        
+        fresh = {tool: info for tool, info in results.items() if self._is_fresh(info)}
+        self._cache.update(fresh)
+        self._persisted.update(fresh)
+    
+    def _save_to_cache_file(self, tool_name: str, tool_info: ToolInfo) -> None:
+        """Write a detection result to the cache file, replacing it atomically."""
+        with self._cache_file_lock:
+            # A fresh, identical result on disk would be loaded anyway
+            persisted = self._persisted.get(tool_name)
+            if persisted is not None and self._is_fresh(persisted) and \
+               _same_detection(persisted, tool_info):
+                return
+            self._persisted[tool_name] = tool_info
+            
+            cache_data = {
+                "timestamp": datetime.now().isoformat(),
+                "results": {
+                    tool: info.to_dict() for tool, info in self._persisted.items()
+                }
+            }
+            
+            temp_path = None
+            try:
+                self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(
+                    dir=self._cache_file.parent, prefix=self._cache_file.name, suffix=".tmp"
+                )
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(cache_data, f, indent=2, ensure_ascii=False)
+                os.replace(temp_path, self._cache_file)
+            except OSError:
+                # Persisting is best effort; the in-memory cache still works
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+    
     def _detect_tool(self, tool_name: str, version_args: List[str], use_cache: bool = True) -> ToolInfo:
         """
         Internal method for comprehensive tool detection.
@@ -182,10 +355,38 @@ class DependencyChecker:
             if cached_result:
                 return cached_result
         
+        # Single-flight: concurrent callers for the same tool wait for the
+        # detection already in progress instead of spawning their own probes
+        with self._detection_lock:
+            inflight = self._inflight.get(tool_name)
+            owner = inflight is None
+            if owner:
+                inflight = self._inflight[tool_name] = threading.Event()
+        
+        if not owner:
+            previous = self._cache.get(tool_name)
+            inflight.wait(timeout=_INFLIGHT_WAIT_SECONDS)
+            shared_result = self._cache.get(tool_name)
+            if shared_result is not None and shared_result is not previous:
+                return shared_result
+            # The other detection failed or timed out; detect independently
+            return self._run_detection(tool_name)
+        
+        try:
+            return self._run_detection(tool_name)
+        finally:
+            with self._detection_lock:
+                del self._inflight[tool_name]
+            inflight.set()
+    
+    def _run_detection(self, tool_name: str) -> ToolInfo:
+        """Search PATH and common locations for a tool and cache the result."""
         tool_info = None
         
-        # Try PATH detection first
-        path_executables = PlatformUtils.find_executables_in_path(tool_name)
+        # Try PATH detection first, reusing a batch lookup from detect_all_tools
+        path_executables = self._path_hints.pop(tool_name, None)
+        if path_executables is None:
+            path_executables = PlatformUtils.find_executables_in_path(tool_name)
         for exe_path in path_executables:
             tool_info = self._validate_tool_execution(exe_path, tool_name)
             if tool_info.status == ToolStatus.FOUND:
@@ -211,6 +412,8 @@ class DependencyChecker:
         # Cache the result
         with self._detection_lock:
             self._cache[tool_name] = tool_info
+        if self._cache_file:
+            self._save_to_cache_file(tool_name, tool_info)
         
         return tool_info
     
@@ -218,6 +421,9 @@ class DependencyChecker:
         """
         Validate tool by executing it and parsing version information.
         
+        The executable is only run again when its size or modification time
+        changed since it was last validated.
+        
         Args:
             path: Path to the tool executable
             tool_name: Name of the tool
@@ -225,6 +431,27 @@ class DependencyChecker:
         Returns:
             ToolInfo with execution validation results
         """
+        try:
+            stat_result = os.stat(path)
+            stat_key = (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            stat_key = None
+        
+        if stat_key is not None:
+            validated = self._validated_paths.get((path, tool_name))
+            if validated is not None and validated[0] == stat_key:
+                return replace(validated[1], detected_at=datetime.now())
+        
+        tool_info = self._execute_tool(path, tool_name)
+        
+        # Errors such as timeouts may be transient, so only keep real answers
+        if stat_key is not None and tool_info.status != ToolStatus.ERROR:
+            self._validated_paths[(path, tool_name)] = (stat_key, tool_info)
+        
+        return tool_info
+    
+    def _execute_tool(self, path: str, tool_name: str) -> ToolInfo:
+        """Run the tool's version command and build a ToolInfo from its output."""
         try:
             # Determine version arguments
             if tool_name == "mkvextract":
@@ -238,7 +465,7 @@ class DependencyChecker:
                 capture_output=True,
                 text=True,
                 timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+                creationflags=_CREATION_FLAGS
             )
             
             if result.returncode != 0:
@@ -249,8 +476,11 @@ class DependencyChecker:
                 )
             
             # Parse version information
-            version_output = result.stdout + result.stderr
-            version = self._extract_version(version_output, tool_name)
+            # Tools print their version to stdout; stderr is only consulted
+            # (and concatenated) when stdout has no recognisable version
+            version = self._extract_version(result.stdout, tool_name)
+            if version == "Unknown" and result.stderr:
+                version = self._extract_version(result.stdout + result.stderr, tool_name)
             
             # Validate version requirements
             requirement = TOOL_REQUIREMENTS.get(tool_name)
@@ -316,26 +546,18 @@ class DependencyChecker:
         if not output:
             return "Unknown"
         
-        lines = output.split('\n')
+        tool_patterns = _VERSION_PATTERNS.get(tool_name, _DEFAULT_VERSION_PATTERNS)
         
-        # Tool-specific version extraction patterns
-        patterns = {
-            "ffmpeg": [
-                r"ffmpeg version (\S+)",
-                r"version (\d+\.\d+(?:\.\d+)?)"
-            ],
-            "ffprobe": [
-                r"ffprobe version (\S+)", 
-                r"version (\d+\.\d+(?:\.\d+)?)"
-            ],
-            "mkvextract": [
-                r"mkvextract v(\d+\.\d+\.\d+)",
-                r"v(\d+\.\d+\.\d+)",
-                r"(\d+\.\d+\.\d+)"
-            ]
-        }
+        # Fast path: the version is on the first line of every supported tool's
+        # output, so try it before splitting the whole (multi-KB) banner
+        first_line = output.partition('\n')[0].strip()
+        if first_line and not first_line.startswith('Copyright'):
+            for pattern in tool_patterns:
+                match = pattern.search(first_line)
+                if match:
+                    return _NON_VERSION_CHARS.sub('', match.group(1).split()[0])
         
-        tool_patterns = patterns.get(tool_name, [r"(\d+\.\d+(?:\.\d+)?(?:\.\d+)?)"])
+        lines = output.split('\n')
         
         for line in lines:
             line = line.strip()
@@ -343,17 +565,16 @@ class DependencyChecker:
                 continue
             
             for pattern in tool_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+                match = pattern.search(line)
                 if match:
                     version = match.group(1)
                     # Clean up version string
-                    version = re.sub(r'[^\d\.]', '', version.split()[0])
+                    version = _NON_VERSION_CHARS.sub('', version.split()[0])
                     return version
         
         # Fallback: look for any version-like pattern
-        version_pattern = r"(\d+\.\d+(?:\.\d+)?(?:\.\d+)?)"
         for line in lines[:5]:  # Check first few lines only
-            match = re.search(version_pattern, line)
+            match = _ANY_VERSION_PATTERN.search(line)
             if match:
                 return match.group(1)
         
@@ -370,41 +591,9 @@ class DependencyChecker:
         Returns:
             -1 if version1 < version2, 0 if equal, 1 if version1 > version2
         """
-        def normalize_version(v: str) -> List[int]:
-            """Normalize version string to list of integers."""
-            if v.lower() == "unknown":
-                return [0]
-            
-            # Remove non-numeric characters except dots
-            v_clean = re.sub(r'[^\d\.]', '', v)
-            parts = v_clean.split('.')
-            
-            # Convert to integers, handling empty parts
-            normalized = []
-            for part in parts:
-                try:
-                    normalized.append(int(part) if part else 0)
-                except ValueError:
-                    normalized.append(0)
-            
-            return normalized
-        
-        v1_parts = normalize_version(version1)
-        v2_parts = normalize_version(version2)
-        
-        # Pad shorter version with zeros
-        max_len = max(len(v1_parts), len(v2_parts))
-        v1_parts.extend([0] * (max_len - len(v1_parts)))
-        v2_parts.extend([0] * (max_len - len(v2_parts)))
-        
-        # Compare part by part
-        for i in range(max_len):
-            if v1_parts[i] < v2_parts[i]:
-                return -1
-            elif v1_parts[i] > v2_parts[i]:
-                return 1
-        
-        return 0
+        v1_parts = _parse_version(version1)
+        v2_parts = _parse_version(version2)
+        return (v1_parts > v2_parts) - (v1_parts < v2_parts)
     
     def _detect_installation_method(self, path: str) -> str:
         """
@@ -416,39 +605,13 @@ class DependencyChecker:
         Returns:
             String describing likely installation method
         """
-        path_str = str(path).lower()
-        
-        # Platform-specific detection
-        platform = PlatformUtils.get_platform()
-        
-        if platform == "windows":
-            if "chocolatey" in path_str:
-                return "chocolatey"
-            elif "scoop" in path_str:
-                return "scoop"
-            elif "program files" in path_str:
-                return "installer"
-            else:
-                return "manual"
-        
-        elif platform == "macos":
-            if "/opt/homebrew" in path_str or "/usr/local" in path_str:
-                return "homebrew"
-            elif "/opt/local" in path_str:
-                return "macports"
-            elif ".app/contents/macos" in path_str:
-                return "app_bundle"
-            else:
-                return "manual"
-        
-        else:  # Linux and others
-            if "/snap/" in path_str:
-                return "snap"
-            elif "flatpak" in path_str:
-                return "flatpak"
-            elif ".appimage" in path_str:
-                return "appimage"
-            elif "/usr/bin" in path_str or "/usr/local/bin" in path_str:
-                return "package_manager"
-            else:
-                return "manual"
\ No newline at end of file
+        path_lower = os.fspath(path).lower()
+        markers = _INSTALLATION_MARKERS.get(
+            PlatformUtils.get_platform(), _INSTALLATION_MARKERS["linux"]
+        )
+        
+        for fragments, method in markers:
+            if any(fragment in path_lower for fragment in fragments):
+                return method
+        
+        return "manual"
\ No newline at end of file
@@ -2,14 +2,138 @@
 MKV Language Detection Utility
 
 This module provides functionality to detect available subtitle languages in MKV files
-using ffprobe. It can analyze single files or entire directories containing MKV files.
+using ffprobe, or PyAV when it is installed. It can analyze single files or entire
+directories containing MKV files.
 """
 
+import os
 import subprocess
 import json
+import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple, Union
+from typing import Iterable, List, Dict, Set, Optional, Tuple, Union
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+
+# Language code to display name mapping; keys are lower-case
+_LANGUAGE_NAMES: Dict[str, str] = {
+    'eng': 'English',
+    'en': 'English', 
+    'spa': 'Spanish',
+    'es': 'Spanish',
+    'fra': 'French',
+    'fr': 'French',
+    'deu': 'German',
+    'de': 'German',
+    'ger': 'German',
+    'ita': 'Italian',
+    'it': 'Italian',
+    'por': 'Portuguese',
+    'pt': 'Portuguese',
+    'rus': 'Russian',
+    'ru': 'Russian',
+    'jpn': 'Japanese',
+    'ja': 'Japanese',
+    'kor': 'Korean',
+    'ko': 'Korean',
+    'chi': 'Chinese',
+    'zh': 'Chinese',
+    'zho': 'Chinese',
+    'cmn': 'Chinese (Mandarin)',
+    'ara': 'Arabic',
+    'ar': 'Arabic',
+    'hin': 'Hindi',
+    'hi': 'Hindi',
+    'ben': 'Bengali',
+    'bn': 'Bengali',
+    'urd': 'Urdu',
+    'ur': 'Urdu',
+    'tha': 'Thai',
+    'th': 'Thai',
+    'vie': 'Vietnamese',
+    'vi': 'Vietnamese',
+    'pol': 'Polish',
+    'pl': 'Polish',
+    'nld': 'Dutch',
+    'nl': 'Dutch',
+    'swe': 'Swedish',
+    'sv': 'Swedish',
+    'dan': 'Danish',
+    'da': 'Danish',
+    'nor': 'Norwegian',
+    'no': 'Norwegian',
+    'fin': 'Finnish',
+    'fi': 'Finnish',
+    'ell': 'Greek',
+    'el': 'Greek',
+    'heb': 'Hebrew',
+    'he': 'Hebrew',
+    'tur': 'Turkish',
+    'tr': 'Turkish',
+    'cze': 'Czech',
+    'cs': 'Czech',
+    'hun': 'Hungarian',
+    'hu': 'Hungarian',
+    'ron': 'Romanian',
+    'ro': 'Romanian',
+    'bul': 'Bulgarian',
+    'bg': 'Bulgarian',
+    'hrv': 'Croatian',
+    'hr': 'Croatian',
+    'srp': 'Serbian',
+    'sr': 'Serbian',
+    'slv': 'Slovenian',
+    'sl': 'Slovenian',
+    'slk': 'Slovak',
+    'sk': 'Slovak',
+    'ukr': 'Ukrainian',
+    'uk': 'Ukrainian',
+    'lit': 'Lithuanian',
+    'lt': 'Lithuanian',
+    'lav': 'Latvian',
+    'lv': 'Latvian',
+    'est': 'Estonian',
+    'et': 'Estonian',
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+# Parses ffprobe's UTF-8 output straight from bytes; orjson.JSONDecodeError
+# subclasses json.JSONDecodeError
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Only the stream fields analyze_mkv_file reads, to keep ffprobe's output small
+_PROBE_ENTRIES = (
+    "stream=index,codec_name"
+    ":stream_tags=language,LANGUAGE,title,TITLE"
+    ":stream_disposition=forced,default"
+)
+
+# libavformat AV_DISPOSITION_* bits, for reading PyAV stream dispositions
+_AV_DISPOSITION_DEFAULT = 0x0001
+_AV_DISPOSITION_FORCED = 0x0040
+
+# Recent analyses keyed by (path, mtime_ns, size), least recently used first
+_ANALYSIS_CACHE_SIZE = 512
+_ANALYSIS_CACHE: "OrderedDict[Tuple[str, int, int], MKVAnalysisResult]" = OrderedDict()
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+# Most ffprobe processes run at once when scanning a directory
+_MAX_PROBE_WORKERS = 8
 
 
 @dataclass
@@ -36,7 +160,7 @@ class MKVAnalysisResult:
 @dataclass
 class LanguageDetectionResult:
     """Result of language detection across multiple files."""
-    available_languages: List[Tuple[str, str]]  # [(code, display_name), ...]
+    available_languages: List[Tuple[str, str]]  # [(code, display_name), ...] by display name
     file_results: List[MKVAnalysisResult]
     total_files: int
     files_with_subtitles: int
@@ -51,86 +175,8 @@ class MKVLanguageDetector:
     providing language codes and display names for UI integration.
     """
     
-    # Language code to display name mapping
-    LANGUAGE_NAMES = {
-        'eng': 'English',
-        'en': 'English', 
-        'spa': 'Spanish',
-        'es': 'Spanish',
-        'fra': 'French',
-        'fr': 'French',
-        'deu': 'German',
-        'de': 'German',
-        'ger': 'German',
-        'ita': 'Italian',
-        'it': 'Italian',
-        'por': 'Portuguese',
-        'pt': 'Portuguese',
-        'rus': 'Russian',
-        'ru': 'Russian',
-        'jpn': 'Japanese',
-        'ja': 'Japanese',
-        'kor': 'Korean',
-        'ko': 'Korean',
-        'chi': 'Chinese',
-        'zh': 'Chinese',
-        'zho': 'Chinese',
-        'cmn': 'Chinese (Mandarin)',
-        'ara': 'Arabic',
-        'ar': 'Arabic',
-        'hin': 'Hindi',
-        'hi': 'Hindi',
-        'ben': 'Bengali',
-        'bn': 'Bengali',
-        'urd': 'Urdu',
-        'ur': 'Urdu',
-        'tha': 'Thai',
-        'th': 'Thai',
-        'vie': 'Vietnamese',
-        'vi': 'Vietnamese',
-        'pol': 'Polish',
-        'pl': 'Polish',
-        'nld': 'Dutch',
-        'nl': 'Dutch',
-        'swe': 'Swedish',
-        'sv': 'Swedish',
-        'dan': 'Danish',
-        'da': 'Danish',
-        'nor': 'Norwegian',
-        'no': 'Norwegian',
-        'fin': 'Finnish',
-        'fi': 'Finnish',
-        'ell': 'Greek',
-        'el': 'Greek',
-        'heb': 'Hebrew',
-        'he': 'Hebrew',
-        'tur': 'Turkish',
-        'tr': 'Turkish',
-        'cze': 'Czech',
-        'cs': 'Czech',
-        'hun': 'Hungarian',
-        'hu': 'Hungarian',
-        'ron': 'Romanian',
-        'ro': 'Romanian',
-        'bul': 'Bulgarian',
-        'bg': 'Bulgarian',
-        'hrv': 'Croatian',
-        'hr': 'Croatian',
-        'srp': 'Serbian',
-        'sr': 'Serbian',
-        'slv': 'Slovenian',
-        'sl': 'Slovenian',
-        'slk': 'Slovak',
-        'sk': 'Slovak',
-        'ukr': 'Ukrainian',
-        'uk': 'Ukrainian',
-        'lit': 'Lithuanian',
-        'lt': 'Lithuanian',
-        'lav': 'Latvian',
-        'lv': 'Latvian',
-        'est': 'Estonian',
-        'et': 'Estonian',
-    }
+    # Language code to display name mapping (read-only)
+    LANGUAGE_NAMES = MappingProxyType(_LANGUAGE_NAMES)
     
     @staticmethod
     def get_language_display_name(language_code: str) -> str:
@@ -145,9 +191,25 @@ class MKVLanguageDetector:
         """
         if not language_code:
             return "Unknown"
+        
+        return _LANGUAGE_NAMES.get(language_code.lower(), language_code.upper())
+    
+    @staticmethod
+    def get_language_display_names(language_codes: Iterable[str]) -> List[str]:
+        """
+        Get display names for many language codes at once.
+        
+        Args:
+            language_codes: ISO language codes, e.g. from a file's subtitle tracks
             
-        code_lower = language_code.lower()
-        return MKVLanguageDetector.LANGUAGE_NAMES.get(code_lower, language_code.upper())
+        Returns:
+            Display names in the same order, as get_language_display_name would give
+        """
+        get_name = _LANGUAGE_NAMES.get
+        return [
+            get_name(code.lower(), code.upper()) if code else "Unknown"
+            for code in language_codes
+        ]
     
     @staticmethod
     def analyze_mkv_file(mkv_file: Path) -> MKVAnalysisResult:
@@ -176,19 +238,65 @@ class MKVLanguageDetector:
                 error=f"Path is not a file: {mkv_file}"
             )
         
+        # Reuse the last analysis while the file's size and mtime are unchanged
+        try:
+            stat_result = mkv_file.stat()
+            cache_key = (str(mkv_file), stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            cache_key = None
+        
+        if cache_key is not None:
+            with _ANALYSIS_CACHE_LOCK:
+                cached = _ANALYSIS_CACHE.get(cache_key)
+                if cached is not None:
+                    _ANALYSIS_CACHE.move_to_end(cache_key)
+                    return cached
+        
+        result = MKVLanguageDetector._probe_mkv_file(mkv_file)
+        
+        # Failures may be transient (e.g. ffprobe missing), so only keep successes
+        if cache_key is not None and result.error is None:
+            with _ANALYSIS_CACHE_LOCK:
+                _ANALYSIS_CACHE[cache_key] = result
+                if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+                    _ANALYSIS_CACHE.popitem(last=False)
+        
+        return result
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached analyses so every file is probed again."""
+        with _ANALYSIS_CACHE_LOCK:
+            _ANALYSIS_CACHE.clear()
+    
+    @staticmethod
+    def _probe_mkv_file(mkv_file: Path) -> MKVAnalysisResult:
+        """Read subtitle track information from an existing MKV file."""
+        # Read the container in-process when PyAV is installed, avoiding an
+        # ffprobe spawn per file
+        if AV_AVAILABLE:
+            subtitle_tracks = MKVLanguageDetector._read_subtitle_tracks_av(mkv_file)
+            if subtitle_tracks is not None:
+                return MKVAnalysisResult(
+                    file_path=mkv_file,
+                    subtitle_tracks=subtitle_tracks,
+                    has_subtitles=len(subtitle_tracks) > 0,
+                    error=None
+                )
+        
         # Use ffprobe to get subtitle stream information
         cmd = [
             "ffprobe",
             "-v", "quiet",
-            "-print_format", "json",
-            "-show_streams",
+            "-print_format", "json=c=1",  # Compact, one stream per line
+            "-show_entries", _PROBE_ENTRIES,
             "-select_streams", "s",  # Select only subtitle streams
             str(mkv_file)
         ]
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            result = subprocess.run(cmd, capture_output=True, check=True)
+            data = _json_loads(result.stdout)
             
             subtitle_tracks = []
             streams = data.get("streams", [])
@@ -238,7 +346,7 @@ class MKVLanguageDetector:
         except subprocess.CalledProcessError as e:
             error_msg = f"ffprobe failed for {mkv_file.name}: {e}"
             if e.stderr:
-                error_msg += f" - {e.stderr}"
+                error_msg += f" - {e.stderr.decode('utf-8', errors='replace')}"
             
             return MKVAnalysisResult(
                 file_path=mkv_file,
@@ -263,6 +371,51 @@ class MKVLanguageDetector:
                 error=f"Unexpected error analyzing {mkv_file.name}: {e}"
             )
     
+    @staticmethod
+    def _read_subtitle_tracks_av(mkv_file: Path) -> Optional[List[SubtitleTrack]]:
+        """
+        Read subtitle track information with PyAV (libavformat in-process).
+        
+        Args:
+            mkv_file: Path to the MKV file to analyze
+            
+        Returns:
+            Subtitle tracks, or None if PyAV failed on the file (or is too old
+            to report dispositions) so the caller should fall back to ffprobe
+        """
+        try:
+            with av.open(str(mkv_file)) as container:
+                subtitle_tracks = []
+                for stream in container.streams.subtitles:
+                    # Stream.disposition only exists from PyAV 13; without it the
+                    # forced/default flags would silently read as unset
+                    disposition = getattr(stream, "disposition", None)
+                    if disposition is None:
+                        return None
+                    disposition = int(disposition)
+                    
+                    tags = stream.metadata
+                    language_code = tags.get("language") or tags.get("LANGUAGE", "")
+                    codec_context = stream.codec_context
+                    
+                    subtitle_tracks.append(SubtitleTrack(
+                        index=stream.index,
+                        language_code=language_code,
+                        language_name=MKVLanguageDetector.get_language_display_name(language_code),
+                        title=tags.get("title") or tags.get("TITLE"),
+                        codec=codec_context.name if codec_context is not None else "",
+                        forced=bool(disposition & _AV_DISPOSITION_FORCED),
+                        default=bool(disposition & _AV_DISPOSITION_DEFAULT)
+                    ))
+                return subtitle_tracks
+        except (av.error.FFmpegError, OSError):
+            return None
+        except Exception:
+            # Anything else (e.g. undecodable tag metadata) is unexpected; log it
+            # but still let ffprobe analyze the file
+            _LOGGER.warning("PyAV could not read %s; falling back to ffprobe", mkv_file, exc_info=True)
+            return None
+    
     @staticmethod
     def find_mkv_files(directory: Path) -> List[Path]:
         """
@@ -274,22 +427,19 @@ class MKVLanguageDetector:
         Returns:
             List of Path objects for MKV files found
         """
-        if not directory.exists() or not directory.is_dir():
+        try:
+            # Single pass, matching the extension case-insensitively
+            with os.scandir(directory) as entries:
+                mkv_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.lower().endswith('.mkv') and entry.is_file()
+                ]
+        except OSError:
+            # Missing, not a directory, or not readable
             return []
         
-        mkv_files = []
-        try:
-            # Search for MKV files (case-insensitive)
-            for pattern in ["*.mkv", "*.MKV"]:
-                mkv_files.extend(directory.glob(pattern))
-                
-            # Sort by name for consistent ordering
-            mkv_files.sort(key=lambda p: p.name.lower())
-            
-        except Exception:
-            # If globbing fails, return empty list
-            pass
-            
+        # Sort by name for consistent ordering
+        mkv_files.sort(key=lambda p: p.name.lower())
         return mkv_files
     
     @staticmethod
@@ -355,8 +505,16 @@ class MKVLanguageDetector:
         errors = []
         files_with_subtitles = 0
         
-        for mkv_file in mkv_files:
-            result = MKVLanguageDetector.analyze_mkv_file(mkv_file)
+        # Each analysis mostly waits on its own ffprobe process, so probe several
+        # files at once; map() yields results in file order
+        analyze = MKVLanguageDetector.analyze_mkv_file
+        if len(mkv_files) == 1:
+            results = [analyze(mkv_files[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(mkv_files))) as executor:
+                results = list(executor.map(analyze, mkv_files))
+        
+        for result in results:
             file_results.append(result)
             
             if result.error:
@@ -366,15 +524,18 @@ class MKVLanguageDetector:
                 files_with_subtitles += 1
                 
                 # Collect all unique language codes
-                for track in result.subtitle_tracks:
-                    if track.language_code:
-                        all_language_codes.add(track.language_code.lower())
+                all_language_codes.update(
+                    track.language_code.lower()
+                    for track in result.subtitle_tracks if track.language_code
+                )
         
-        # Convert language codes to display format
-        available_languages = []
-        for code in sorted(all_language_codes):
-            display_name = MKVLanguageDetector.get_language_display_name(code)
-            available_languages.append((code, display_name))
+        # Convert language codes to display format, ordered by display name
+        # (then code) so pickers can list them as-is
+        codes = list(all_language_codes)
+        available_languages = sorted(
+            zip(codes, MKVLanguageDetector.get_language_display_names(codes)),
+            key=lambda language: (language[1], language[0])
+        )
         
         return LanguageDetectionResult(
             available_languages=available_languages,
@@ -7,11 +7,114 @@ and installation guidance across Windows, macOS, and Linux.
 
 import os
 import platform
+import re
 import subprocess
 import shutil
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
-import glob
+import fnmatch
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _system_name() -> str:
+    """Lower-cased OS name; the platform does not change while running."""
+    return platform.system().lower()
+
+
+@lru_cache(maxsize=1)
+def _platform_details() -> Dict[str, str]:
+    """
+    OS release, architecture and distribution details.
+    
+    Gathering these reads /etc/os-release, runs sw_vers or queries the
+    registry, so it is done once per process.
+    """
+    system = platform.system()
+    info = {
+        "system": system,
+        "release": platform.release(),
+        "machine": platform.machine(),
+    }
+    
+    # Add platform-specific details
+    if system == "Linux":
+        info.update(PlatformUtils._get_linux_distro_info())
+    elif system == "Darwin":
+        info.update(PlatformUtils._get_macos_version_info())
+    elif system == "Windows":
+        info.update(PlatformUtils._get_windows_version_info())
+    
+    return info
+
+
+# Parent-directory steps, home shortcuts and variable references, rejected in
+# tool paths by validate_path_security
+_SUSPICIOUS_PATH_PATTERN = re.compile(r"\.\./|\.\.\\|~|\$")
+
+# Install directories under each Program Files location, per tool
+_WINDOWS_INSTALL_DIRS: Dict[str, Tuple[str, ...]] = {
+    "ffmpeg": (r"ffmpeg\bin", r"FFmpeg\bin", r"ffmpeg-master-latest-win64-gpl\bin"),
+    "ffprobe": (r"ffmpeg\bin", r"FFmpeg\bin", r"ffmpeg-master-latest-win64-gpl\bin"),
+    "mkvextract": ("MKVToolNix", "mkvtoolnix"),
+}
+
+_CHOCOLATEY_BIN = r"C:\ProgramData\chocolatey\bin"
+
+# Scoop app directories under ~/scoop/apps, per tool
+_SCOOP_APP_DIRS: Dict[str, str] = {
+    "ffmpeg": "ffmpeg/current/bin",
+    "ffprobe": "ffmpeg/current/bin",
+    "mkvextract": "mkvtoolnix/current",
+}
+
+# Intel and Apple Silicon Homebrew, then MacPorts
+_MACOS_PACKAGE_BIN_DIRS = ("/usr/local/bin", "/opt/homebrew/bin", "/opt/local/bin")
+_MACOS_SYSTEM_BIN_DIRS = ("/usr/bin", "/usr/local/bin")
+
+# Standard system directories, then Snap and Flatpak exports
+_LINUX_BIN_DIRS = (
+    "/usr/bin",
+    "/usr/local/bin",
+    "/opt/bin",
+    "/bin",
+    "/usr/sbin",
+    "/usr/local/sbin",
+    "/snap/bin",
+    "/var/lib/flatpak/exports/bin",
+)
+
+
+@lru_cache(maxsize=1)
+def _home_dir() -> Path:
+    """The user's home directory, resolved once until clear_directory_cache()."""
+    return Path.home()
+
+
+@lru_cache(maxsize=4)
+def _path_dirs(path_env: str) -> Tuple[str, ...]:
+    """Non-empty PATH entries; keyed by the PATH value so changes are picked up."""
+    return tuple(path_dir for path_dir in path_env.split(os.pathsep) if path_dir)
+
+
+@lru_cache(maxsize=32)
+def _list_directory(directory: str) -> Tuple[str, ...]:
+    """Names in a directory, read once until clear_directory_cache()."""
+    try:
+        with os.scandir(directory) as entries:
+            return tuple(entry.name for entry in entries)
+    except OSError:
+        # Missing or unreadable directories simply have no entries
+        return ()
+
+
+def _matching_entries(directory: str, pattern: str) -> List[str]:
+    """Paths in a directory whose names match a glob pattern, like glob.glob."""
+    return [
+        f"{directory}/{name}"
+        for name in fnmatch.filter(_list_directory(directory), pattern)
+        if not name.startswith('.')  # glob's "*" skips hidden files
+    ]
 
 
 class PlatformUtils:
@@ -20,7 +123,7 @@ class PlatformUtils:
     @staticmethod
     def get_platform() -> str:
         """Get normalized platform identifier."""
-        system = platform.system().lower()
+        system = _system_name()
         if system == "darwin":
             return "macos"
         return system
@@ -28,25 +131,9 @@ class PlatformUtils:
     @staticmethod
     def get_platform_info() -> Dict[str, str]:
         """Get detailed platform information."""
-        system = platform.system()
-        release = platform.release()
-        machine = platform.machine()
-        
-        info = {
-            "system": system,
-            "release": release,
-            "machine": machine,
-            "platform": PlatformUtils.get_platform()
-        }
-        
-        # Add platform-specific details
-        if system == "Linux":
-            info.update(PlatformUtils._get_linux_distro_info())
-        elif system == "Darwin":
-            info.update(PlatformUtils._get_macos_version_info())
-        elif system == "Windows":
-            info.update(PlatformUtils._get_windows_version_info())
-        
+        # Copy, so callers may modify their result without touching the cache
+        info = dict(_platform_details())
+        info["platform"] = PlatformUtils.get_platform()
         return info
     
     @staticmethod
@@ -120,6 +207,12 @@ class PlatformUtils:
         
         return info
     
+    @staticmethod
+    def clear_directory_cache() -> None:
+        """Forget cached directory listings and the resolved home directory."""
+        _list_directory.cache_clear()
+        _home_dir.cache_clear()
+    
     @staticmethod
     def get_executable_name(tool_name: str) -> str:
         """Get platform-appropriate executable name."""
@@ -142,7 +235,7 @@ class PlatformUtils:
             paths.extend(PlatformUtils._get_linux_tool_paths(tool_name, executable_name))
         
         # Add user-specific paths that are common across platforms
-        home = Path.home()
+        home = _home_dir()
         paths.extend([
             str(home / "bin" / executable_name),
             str(home / ".local" / "bin" / executable_name),
@@ -163,109 +256,64 @@ class PlatformUtils:
             os.environ.get("ProgramW6432", r"C:\Program Files"),
         ]
         
+        install_dirs = _WINDOWS_INSTALL_DIRS.get(tool_name, ())
         for pf_dir in program_files_dirs:
-            if not pf_dir:
-                continue
-                
-            if tool_name in ["ffmpeg", "ffprobe"]:
-                # Common FFmpeg installation paths
-                paths.extend([
-                    f"{pf_dir}\\ffmpeg\\bin\\{executable_name}",
-                    f"{pf_dir}\\FFmpeg\\bin\\{executable_name}",
-                    f"{pf_dir}\\ffmpeg-master-latest-win64-gpl\\bin\\{executable_name}",
-                ])
-            elif tool_name == "mkvextract":
-                # Common MKVToolNix installation paths
-                paths.extend([
-                    f"{pf_dir}\\MKVToolNix\\{executable_name}",
-                    f"{pf_dir}\\mkvtoolnix\\{executable_name}",
-                ])
+            if pf_dir:
+                paths.extend(f"{pf_dir}\\{install_dir}\\{executable_name}" for install_dir in install_dirs)
         
         # Chocolatey paths
-        choco_bin = r"C:\ProgramData\chocolatey\bin"
-        paths.append(f"{choco_bin}\\{executable_name}")
+        paths.append(f"{_CHOCOLATEY_BIN}\\{executable_name}")
         
         # Scoop paths
-        scoop_apps = Path.home() / "scoop" / "apps"
-        if tool_name in ["ffmpeg", "ffprobe"]:
-            paths.extend([
-                str(scoop_apps / "ffmpeg" / "current" / "bin" / executable_name),
-            ])
-        elif tool_name == "mkvextract":
-            paths.extend([
-                str(scoop_apps / "mkvtoolnix" / "current" / executable_name),
-            ])
+        scoop_dir = _SCOOP_APP_DIRS.get(tool_name)
+        if scoop_dir:
+            paths.append(str(_home_dir() / "scoop" / "apps" / scoop_dir / executable_name))
         
         return paths
     
     @staticmethod
     def _get_macos_tool_paths(tool_name: str, executable_name: str) -> List[str]:
         """Get macOS-specific tool paths."""
-        paths = []
         platform_info = PlatformUtils.get_platform_info()
         
-        # Homebrew paths (different for Intel vs Apple Silicon)
+        # Homebrew path for this machine first (different for Intel vs Apple Silicon)
         homebrew_prefix = platform_info.get("default_homebrew_path", "/usr/local")
-        paths.append(f"{homebrew_prefix}/bin/{executable_name}")
-        
-        # Check both Intel and Apple Silicon Homebrew paths
-        for brew_path in ["/usr/local", "/opt/homebrew"]:
-            paths.append(f"{brew_path}/bin/{executable_name}")
+        paths = [f"{homebrew_prefix}/bin/{executable_name}"]
         
-        # MacPorts
-        paths.append(f"/opt/local/bin/{executable_name}")
+        # Both Homebrew prefixes, then MacPorts
+        paths.extend(f"{bin_dir}/{executable_name}" for bin_dir in _MACOS_PACKAGE_BIN_DIRS)
         
         # Application bundles for GUI tools
         if tool_name == "mkvextract":
             # MKVToolNix app bundle
-            app_pattern = "/Applications/MKVToolNix-*.app/Contents/MacOS/mkvextract"
-            paths.extend(glob.glob(app_pattern))
+            for bundle in _matching_entries("/Applications", "MKVToolNix-*.app"):
+                bundle_tool = f"{bundle}/Contents/MacOS/mkvextract"
+                if os.path.exists(bundle_tool):
+                    paths.append(bundle_tool)
             paths.append("/Applications/MKVToolNix.app/Contents/MacOS/mkvextract")
         
         # System paths
-        paths.extend([
-            f"/usr/bin/{executable_name}",
-            f"/usr/local/bin/{executable_name}",
-        ])
+        paths.extend(f"{bin_dir}/{executable_name}" for bin_dir in _MACOS_SYSTEM_BIN_DIRS)
         
         return paths
     
     @staticmethod
     def _get_linux_tool_paths(tool_name: str, executable_name: str) -> List[str]:
         """Get Linux-specific tool paths."""
-        paths = []
-        
-        # Standard system paths
-        system_paths = [
-            "/usr/bin",
-            "/usr/local/bin", 
-            "/opt/bin",
-            "/bin",
-            "/usr/sbin",
-            "/usr/local/sbin"
-        ]
-        
-        for sys_path in system_paths:
-            paths.append(f"{sys_path}/{executable_name}")
-        
-        # Snap packages
-        paths.append(f"/snap/bin/{executable_name}")
-        
-        # Flatpak
-        paths.append(f"/var/lib/flatpak/exports/bin/{executable_name}")
+        # Standard system paths, then Snap and Flatpak
+        paths = [f"{bin_dir}/{executable_name}" for bin_dir in _LINUX_BIN_DIRS]
         
         # AppImage locations
+        home = _home_dir()
         appimage_dirs = [
-            str(Path.home() / "Applications"),
-            str(Path.home() / "appimages"),
+            str(home / "Applications"),
+            str(home / "appimages"),
             "/opt/appimages"
         ]
         
         for appimage_dir in appimage_dirs:
-            if Path(appimage_dir).exists():
-                # Look for AppImages
-                pattern = f"{appimage_dir}/*{tool_name}*.AppImage"
-                paths.extend(glob.glob(pattern))
+            # Look for AppImages
+            paths.extend(_matching_entries(appimage_dir, f"*{tool_name}*.AppImage"))
         
         return paths
     
@@ -405,26 +453,48 @@ Option 3: AppImage
         return f"Please install {tool_name} for Linux"
     
     @staticmethod
-    def find_executables_in_path(tool_name: str) -> List[str]:
-        """Find all instances of an executable in PATH."""
-        executable_name = PlatformUtils.get_executable_name(tool_name)
-        executables = []
+    def find_executables_in_path(tool_name: str, first_only: bool = False) -> List[str]:
+        """
+        Find all instances of an executable in PATH.
         
-        # Get PATH environment variable
-        path_env = os.environ.get("PATH", "")
-        path_dirs = path_env.split(os.pathsep)
+        With first_only, stop at the first match like ``which`` and return
+        at most one path; only PATH entries before it are checked.
+        """
+        if not first_only:
+            return PlatformUtils.find_executables_batch([tool_name])[tool_name]
         
-        for path_dir in path_dirs:
-            if not path_dir:
-                continue
-                
+        executable_name = PlatformUtils.get_executable_name(tool_name)
+        for path_dir in _path_dirs(os.environ.get("PATH", "")):
+            exe_path = str(Path(path_dir) / executable_name)
+            if os.path.isfile(exe_path) and os.access(exe_path, os.X_OK):
+                return [exe_path]
+        return []
+    
+    @staticmethod
+    def find_executables_batch(tool_names: List[str]) -> Dict[str, List[str]]:
+        """Find all instances of several executables in one pass over PATH."""
+        # Executable name (case-folded where the filesystem ignores case) -> tool
+        wanted = {
+            os.path.normcase(PlatformUtils.get_executable_name(tool_name)): tool_name
+            for tool_name in tool_names
+        }
+        executables: Dict[str, List[str]] = {tool_name: [] for tool_name in tool_names}
+        
+        for path_dir in _path_dirs(os.environ.get("PATH", "")):
+            # One directory read per PATH entry; names are matched in memory and
+            # DirEntry reuses the file type from the listing where it can
             try:
-                exe_path = Path(path_dir) / executable_name
-                if exe_path.exists() and exe_path.is_file():
-                    # Check if executable
-                    if os.access(str(exe_path), os.X_OK):
-                        executables.append(str(exe_path))
-            except (OSError, PermissionError):
+                with os.scandir(path_dir) as entries:
+                    for entry in entries:
+                        tool_name = wanted.get(os.path.normcase(entry.name))
+                        if tool_name is None or not entry.is_file():
+                            continue
+                        
+                        exe_path = str(Path(path_dir) / entry.name)
+                        # Check if executable
+                        if os.access(exe_path, os.X_OK):
+                            executables[tool_name].append(exe_path)
+            except OSError:
                 # Skip directories we can't access
                 continue
         
@@ -452,8 +522,7 @@ Option 3: AppImage
             path_str = str(path_obj)
             
             # Reject paths with suspicious patterns
-            suspicious_patterns = ["../", "..\\", "~", "$"]
-            if any(pattern in path_str for pattern in suspicious_patterns):
+            if _SUSPICIOUS_PATH_PATTERN.search(path_str):
                 return False, "Path contains suspicious characters"
             
             # Ensure path is absolute after resolution
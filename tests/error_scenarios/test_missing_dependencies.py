@@ -68,7 +68,8 @@ class TestMissingSystemDependencies:
         """Test when all required dependencies are missing."""
         checker = DependencyChecker()
         
-        with patch.object(PlatformUtils, 'find_executables_in_path', return_value=[]):
+        with patch.object(PlatformUtils, 'find_executables_batch',
+                          side_effect=lambda tools: {tool: [] for tool in tools}):
             with patch.object(PlatformUtils, 'get_common_tool_paths', return_value=[]):
                 results = checker.detect_all_tools(use_cache=False)
                 
@@ -258,17 +259,17 @@ class TestConfigurationErrors:
         with patch('app.config.config_manager.QStandardPaths.writableLocation') as mock_location:
             mock_location.return_value = str(temp_dir)
             
-            config_manager = ConfigManager()
-            
             # Create corrupted cache file
             cache_file = temp_dir / "tool_cache.json"
             cache_file.write_text("invalid json {")
             
             # Should handle gracefully and not crash
             try:
-                config_manager._load_tool_detection_cache()
+                config_manager = ConfigManager()
             except Exception as e:
                 pytest.fail(f"Should handle corrupted cache gracefully: {e}")
+            
+            assert config_manager._dependency_checker.get_cached_result("ffmpeg") is None
 
 
 @pytest.mark.error_scenario
@@ -427,7 +428,10 @@ class TestDependencyRecovery:
                 return ["/usr/bin/ffmpeg"]
             return []
         
-        with patch.object(PlatformUtils, 'find_executables_in_path', side_effect=mock_find_executable):
+        def mock_find_batch(tool_names):
+            return {tool_name: mock_find_executable(tool_name) for tool_name in tool_names}
+        
+        with patch.object(PlatformUtils, 'find_executables_batch', side_effect=mock_find_batch):
             with patch.object(checker, '_validate_tool_execution') as mock_validate:
                 def mock_validation(path, tool_name):
                     if tool_name == "ffmpeg":
@@ -175,7 +175,38 @@ class TestExecutableDetection:
         if hasattr(PlatformUtils, 'is_executable'):
             assert PlatformUtils.is_executable(str(test_exe)) is True
             assert PlatformUtils.is_executable(str(test_file)) is False
-    
+
+    def test_find_executables_in_path_dirs(self, temp_dir):
+        """Test finding executables across PATH directories in PATH order."""
+        first_dir = temp_dir / "first"
+        second_dir = temp_dir / "second"
+        (second_dir / "ffmpeg").mkdir(parents=True)  # A directory is not an executable
+        first_dir.mkdir()
+
+        with patch.object(PlatformUtils, 'get_platform', return_value="linux"):
+            for directory in (first_dir, temp_dir):
+                tool = directory / "ffmpeg"
+                tool.write_text("#!/bin/sh\necho 'test'")
+                tool.chmod(0o755)
+            (temp_dir / "ffprobe").write_text("not executable")
+            (temp_dir / "ffprobe").chmod(0o644)
+
+            path_env = os.pathsep.join([
+                str(first_dir), str(second_dir), str(temp_dir / "missing"), str(temp_dir)
+            ])
+            with patch.dict(os.environ, {'PATH': path_env}):
+                found = PlatformUtils.find_executables_batch(["ffmpeg", "ffprobe"])
+                single = PlatformUtils.find_executables_in_path("ffmpeg")
+                first = PlatformUtils.find_executables_in_path("ffmpeg", first_only=True)
+                missing = PlatformUtils.find_executables_in_path("mkvextract", first_only=True)
+
+        assert found["ffmpeg"] == [str(first_dir / "ffmpeg"), str(temp_dir / "ffmpeg")]
+        assert single == found["ffmpeg"]
+        assert first == [str(first_dir / "ffmpeg")]
+        assert missing == []
+        if platform.system() != "Windows":
+            assert found["ffprobe"] == []
+
     def test_case_sensitive_executable_search(self):
         """Test case sensitivity in executable search."""
         # This is platform-dependent
@@ -233,7 +264,11 @@ class TestConfigurationStorage:
     
     def test_config_directory_location(self, qapp):
         """Test configuration directory follows platform conventions."""
-        with patch('app.config.config_manager.QStandardPaths.writableLocation') as mock_location:
+        # The mocked locations are not real on this machine; keep ConfigManager
+        # from creating them (a Windows path would become a relative directory)
+        with patch('app.config.config_manager.QStandardPaths.writableLocation') as mock_location, \
+             patch.object(Path, 'mkdir'), \
+             patch.object(ConfigManager, '_save_settings'):
             # Mock different platform locations
             platform_locations = {
                 "windows": "C:\\Users\\test\\AppData\\Roaming\\SubtitleToolkit",
@@ -13,6 +13,7 @@ Following TDD principles:
 """
 
 import json
+import os
 import tempfile
 import threading
 import time
@@ -25,6 +26,7 @@ from PySide6.QtCore import QObject, QThread
 
 from app.config.config_manager import ConfigManager, BackgroundDetectionWorker
 from app.config.settings_schema import SettingsSchema, ValidationResult
+from app.utils.platform_utils import PlatformUtils
 from app.utils.tool_status import ToolStatus, ToolInfo
 
 
@@ -537,6 +539,50 @@ class TestBackgroundDetectionIntegration:
             # Should have new worker
             assert config_manager._detection_worker is not None
 
+    def test_detection_cache_single_writer(self, qapp, temp_dir):
+        """Test that tool_cache.json is written once per detection and read with one TTL."""
+        with patch('app.config.config_manager.QStandardPaths.writableLocation') as mock_location:
+            mock_location.return_value = str(temp_dir)
+
+            config_manager = ConfigManager()
+            cache_file = config_manager._tool_detection_cache_file
+
+            worker = BackgroundDetectionWorker(config_manager._dependency_checker, ['ffmpeg'])
+            worker.detection_complete.connect(config_manager._on_background_detection_complete)
+
+            writes = []
+            real_open, real_replace = open, os.replace
+            def record_open(file, mode='r', *args, **kwargs):
+                if 'w' in mode and isinstance(file, (str, Path)) and Path(file) == cache_file:
+                    writes.append(('open', file))
+                return real_open(file, mode, *args, **kwargs)
+            def record_replace(src, dst):
+                if Path(dst) == cache_file:
+                    writes.append(('replace', dst))
+                real_replace(src, dst)
+
+            with patch('builtins.open', side_effect=record_open), \
+                 patch('app.utils.dependency_checker.os.replace', side_effect=record_replace), \
+                 patch.object(PlatformUtils, 'find_executables_in_path', return_value=[]), \
+                 patch.object(PlatformUtils, 'get_common_tool_paths', return_value=[]):
+                worker.run()
+
+            # Only the dependency checker writes the file, atomically
+            assert [kind for kind, _ in writes] == ['replace']
+            assert not list(temp_dir.glob("tool_cache.json*.tmp"))
+
+            # A restart reloads results younger than the checker's TTL...
+            restarted = ConfigManager()
+            assert restarted._dependency_checker.get_cached_result('ffmpeg') is not None
+
+            # ...and drops older ones, with no separate ConfigManager TTL
+            cache_data = json.loads(cache_file.read_text())
+            ttl = restarted._dependency_checker.cache_ttl
+            stale = (datetime.now() - ttl - timedelta(minutes=1)).isoformat()
+            cache_data["results"]["ffmpeg"]["detected_at"] = stale
+            cache_file.write_text(json.dumps(cache_data))
+            assert ConfigManager()._dependency_checker.get_cached_result('ffmpeg') is None
+
 
 @pytest.mark.unit
 class TestConfigManagerErrorHandling:
@@ -16,6 +16,7 @@ Following TDD principles:
 import subprocess
 import tempfile
 import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
@@ -208,7 +209,33 @@ class TestDependencyChecker:
             
             assert tool_info.status == ToolStatus.ERROR
             assert "Subprocess error" in tool_info.error_message
-    
+
+    def test_tool_execution_skipped_for_unchanged_file(self):
+        """Test that an unchanged executable is not run again."""
+        checker = DependencyChecker()
+
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = "ffmpeg version 6.0.0"
+        mock_result.stderr = ""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tool_path = Path(temp_dir) / "ffmpeg"
+            tool_path.write_text("binary")
+
+            with patch('subprocess.run', return_value=mock_result) as mock_run:
+                first = checker._validate_tool_execution(str(tool_path), 'ffmpeg')
+                second = checker._validate_tool_execution(str(tool_path), 'ffmpeg')
+
+                assert mock_run.call_count == 1
+                assert second.version == first.version == "6.0.0"
+
+                # A replaced binary is executed again
+                tool_path.write_text("upgraded binary")
+                checker._validate_tool_execution(str(tool_path), 'ffmpeg')
+
+                assert mock_run.call_count == 2
+
     def test_version_extraction_ffmpeg(self):
         """Test version extraction for ffmpeg output."""
         checker = DependencyChecker()
@@ -340,6 +367,71 @@ class TestDependencyChecker:
                     assert final_call[0] == "complete"
                     assert final_call[1] == 100
 
+    
+    def test_detect_all_tools_runs_concurrently(self):
+        """Test that tool detections overlap instead of running one after another."""
+        checker = DependencyChecker()
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def detect(use_cache=True):
+            # Only passes if all three detections are in flight at once
+            barrier.wait()
+            return ToolInfo(status=ToolStatus.FOUND)
+        
+        with patch.object(checker, 'detect_ffmpeg', side_effect=detect), \
+             patch.object(checker, 'detect_ffprobe', side_effect=detect), \
+             patch.object(checker, 'detect_mkvextract', side_effect=detect):
+            results = checker.detect_all_tools(use_cache=False)
+        
+        assert list(results) == ["ffmpeg", "ffprobe", "mkvextract"]
+        assert all(info.status == ToolStatus.FOUND for info in results.values())
+
+    def test_detect_all_tools_scans_path_once(self):
+        """Test that detecting all tools shares a single PATH lookup."""
+        checker = DependencyChecker()
+
+        with patch.object(PlatformUtils, 'find_executables_batch',
+                          side_effect=lambda tools: {tool: [] for tool in tools}) as mock_batch, \
+             patch.object(PlatformUtils, 'find_executables_in_path') as mock_find, \
+             patch.object(PlatformUtils, 'get_common_tool_paths', return_value=[]):
+            results = checker.detect_all_tools(use_cache=False)
+
+        mock_batch.assert_called_once_with(["ffmpeg", "ffprobe", "mkvextract"])
+        mock_find.assert_not_called()
+        assert all(info.status == ToolStatus.NOT_FOUND for info in results.values())
+        assert checker._path_hints == {}
+
+    def test_concurrent_detection_single_flight(self):
+        """Test that concurrent detections of one tool share a single probe."""
+        checker = DependencyChecker()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def validate(path, tool_name):
+            calls.append(path)
+            started.set()
+            release.wait(timeout=5)
+            return ToolInfo(status=ToolStatus.FOUND, path=path)
+        
+        with patch('app.utils.dependency_checker.PlatformUtils.find_executables_in_path',
+                   return_value=["/usr/bin/ffmpeg"]), \
+             patch.object(checker, '_validate_tool_execution', side_effect=validate):
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(checker.detect_ffmpeg(use_cache=False)))
+                       for _ in range(3)]
+            threads[0].start()
+            started.wait(timeout=5)
+            for thread in threads[1:]:
+                thread.start()
+            time.sleep(0.2)  # let the other callers reach the in-flight wait
+            release.set()
+            for thread in threads:
+                thread.join(timeout=5)
+        
+        assert calls == ["/usr/bin/ffmpeg"]
+        assert len(results) == 3
+        assert all(result is results[0] for result in results)
 
 @pytest.mark.unit
 class TestDependencyCheckerCaching:
@@ -438,7 +530,36 @@ class TestDependencyCheckerCaching:
         cached = checker.get_cached_result('ffmpeg')
         assert cached is not None
         assert cached.path == "/usr/bin/ffmpeg"
-    
+
+    def test_cache_file_persists_results(self):
+        """Test that detection results are reloaded from the cache file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "tool_cache.json"
+            checker = DependencyChecker(cache_file=cache_file)
+
+            with patch.object(PlatformUtils, 'find_executables_in_path', return_value=[]):
+                with patch.object(PlatformUtils, 'get_common_tool_paths', return_value=[]):
+                    result = checker.detect_ffmpeg()
+
+            assert cache_file.exists()
+
+            # A new checker (e.g. after a restart) answers from the file
+            restarted = DependencyChecker(cache_file=cache_file)
+            with patch.object(PlatformUtils, 'find_executables_in_path') as mock_find:
+                cached = restarted.detect_ffmpeg()
+                mock_find.assert_not_called()
+
+            assert cached.status == result.status
+            assert cached.error_message == result.error_message
+
+            # Expired results in the file are ignored
+            expired = DependencyChecker(cache_ttl_minutes=0, cache_file=cache_file)
+            assert expired.get_cached_result('ffmpeg') is None
+
+            # A corrupted file is ignored rather than failing startup
+            cache_file.write_text("invalid json {")
+            assert DependencyChecker(cache_file=cache_file).get_cached_result('ffmpeg') is None
+
     def test_thread_safety_of_cache(self):
         """Test thread safety of cache operations."""
         checker = DependencyChecker()
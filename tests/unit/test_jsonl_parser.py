@@ -17,6 +17,7 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
 
+from app.runner import jsonl_parser
 from app.runner.jsonl_parser import JSONLParser, StreamBuffer, JSONLValidator
 from app.runner.events import Event, EventType, Stage
 
@@ -29,7 +30,7 @@ class TestJSONLParser:
         """Test parser initializes correctly."""
         parser = JSONLParser()
         
-        assert parser._buffer == ""
+        assert parser._chunks == []
         assert parser._lines_processed == 0
         assert parser._events_parsed == 0
         assert parser._parse_errors == 0
@@ -87,7 +88,7 @@ class TestJSONLParser:
         
         # Should not parse anything yet
         assert len(events) == 0
-        assert parser._buffer == partial_json
+        assert "".join(parser._chunks) == partial_json
         
         # Complete the JSON
         remaining_json = ', "type": "info", "msg": "test"}\n'
@@ -99,7 +100,58 @@ class TestJSONLParser:
         assert successful_events[0].message == "test"
         
         # Buffer should be empty
-        assert parser._buffer == ""
+        assert parser._chunks == []
+    
+    def test_long_line_across_many_chunks(self, qapp):
+        """Test that a line fed in many small text chunks is parsed once complete."""
+        parser = JSONLParser()
+        line = '{"ts": "2025-08-08T07:42:01Z", "stage": "extract", "type": "info", "msg": "' + "x" * 500 + '"}\n'
+        
+        events = []
+        for i in range(0, len(line), 7):
+            events.extend(parser.parse_stream_data(line[i:i + 7]))
+        
+        assert len(events) == 1
+        assert events[0][0].message == "x" * 500
+        assert parser.get_stats()['buffer_size'] == 0
+    
+    def test_parse_stream_bytes(self, qapp):
+        """Test parsing raw bytes with a line and a UTF-8 character split across chunks."""
+        parser = JSONLParser()
+        
+        data = ('{"ts": "2025-08-08T07:42:01Z", "stage": "extract", "type": "info", "msg": "Първи"}\n'
+                '{"ts": "2025-08-08T07:42:02Z", "stage": "extract", "type": "info", "msg": "Втори"}\n').encode()
+        split_at = data.index("Втори".encode()) + 1
+        
+        first = list(parser.parse_stream_bytes(data[:split_at]))
+        assert [event.message for event, error in first] == ["Първи"]
+        
+        second = list(parser.parse_stream_bytes(data[split_at:]))
+        assert [event.message for event, error in second] == ["Втори"]
+        assert parser.get_stats()['buffer_size'] == 0
+        
+        # A line trickling in byte by byte is emitted once its newline arrives
+        line = '{"ts": "2025-08-08T07:42:03Z", "stage": "extract", "type": "info", "msg": "Бавно"}\n'.encode()
+        trickled = [result for i in range(len(line)) for result in parser.parse_stream_bytes(line[i:i + 1])]
+        assert [event.message for event, error in trickled] == ["Бавно"]
+        
+        # Unterminated trailing line is parsed on flush
+        list(parser.parse_stream_bytes(b'{"ts": "2025-08-08T07:42:03Z", "stage": "extract", "type": "info", "msg": "Last"}'))
+        flushed = list(parser.flush_buffer())
+        assert [event.message for event, error in flushed] == ["Last"]
+    
+    def test_parse_stream_bytes_non_utf8_line(self, qapp):
+        """Test that a line that is not valid UTF-8 (e.g. a cp1252 pipe) is still parsed."""
+        line = '{"ts": "2025-08-08T07:42:01Z", "stage": "sync", "type": "info", "msg": "Renamed Café.srt"}\n'
+        
+        # orjson when installed, and the stdlib fallback
+        for loads in {jsonl_parser._json_loads, json.loads}:
+            parser = JSONLParser()
+            with patch.object(jsonl_parser, '_json_loads', loads):
+                results = list(parser.parse_stream_bytes(line.encode('cp1252')))
+            
+            assert [(event.message, error) for event, error in results] == [("Renamed Caf\ufffd.srt", None)]
+            assert parser.get_stats()['parse_errors'] == 0
     
     def test_multiple_lines_in_single_stream(self, qapp):
         """Test parsing multiple complete lines in a single data chunk."""
@@ -154,7 +206,7 @@ not json at all
         
         # Should be buffered, not parsed
         assert len(events) == 0
-        assert parser._buffer == incomplete_data
+        assert "".join(parser._chunks) == incomplete_data
         
         # Flush buffer
         flush_events = list(parser.flush_buffer())
@@ -163,7 +215,7 @@ not json at all
         # Should parse the buffered data
         assert len(successful_events) == 1
         assert successful_events[0].message == "test"
-        assert parser._buffer == ""
+        assert parser._chunks == []
     
     def test_empty_and_whitespace_lines(self, qapp):
         """Test handling of empty lines and whitespace-only lines."""
@@ -227,13 +279,13 @@ not json at all
         # Should have some state
         assert parser._lines_processed > 0
         assert parser._events_parsed > 0
-        assert len(parser._buffer) > 0
+        assert parser._chunks
         
         # Reset parser
         parser.reset()
         
         # All state should be cleared
-        assert parser._buffer == ""
+        assert parser._chunks == []
         assert parser._lines_processed == 0
         assert parser._events_parsed == 0
         assert parser._parse_errors == 0
@@ -8,7 +8,12 @@ with the existing project structure and ffprobe dependency.
 
 import sys
 import os
+import subprocess
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 # Add the project root to Python path so we can import app modules
 project_root = Path(__file__).parent
@@ -17,7 +22,10 @@ sys.path.insert(0, str(project_root))
 # Set environment variable to indicate we're running from the project root
 os.environ['SUBTITLE_TOOLKIT_PROJECT_ROOT'] = str(project_root)
 
-from app.utils.mkv_language_detector import MKVLanguageDetector, LanguageDetectionResult
+from app.utils import mkv_language_detector
+from app.utils.mkv_language_detector import (
+    MKVLanguageDetector, LanguageDetectionResult, MKVAnalysisResult, SubtitleTrack
+)
 
 
 def test_language_mapping():
@@ -135,6 +143,170 @@ def test_file_detection(test_file: str):
     print()
 
 
+class _FakeFFmpegError(Exception):
+    """Stand-in for av.error.FFmpegError."""
+
+
+def _fake_av(streams):
+    """Build a minimal PyAV module whose containers hold the given subtitle streams."""
+    container = MagicMock()
+    container.__enter__.return_value = container
+    container.streams.subtitles = streams
+    return SimpleNamespace(
+        open=MagicMock(return_value=container),
+        error=SimpleNamespace(FFmpegError=_FakeFFmpegError)
+    )
+
+
+def _subtitle_stream(index, language, **extra):
+    """Build a PyAV-like subtitle stream."""
+    return SimpleNamespace(
+        index=index,
+        metadata={"language": language},
+        codec_context=SimpleNamespace(name="subrip"),
+        **extra
+    )
+
+
+FFPROBE_OUTPUT = (
+    b'{"streams": [\n'
+    b'{"index": 2, "codec_name": "subrip", "disposition": {"default": 1, "forced": 0},'
+    b' "tags": {"language": "eng", "title": "Full"}}\n'
+    b']}'
+)
+
+
+@pytest.fixture
+def mkv_file(temp_dir):
+    """An (empty) MKV file; probing is mocked."""
+    path = temp_dir / "movie.mkv"
+    path.write_bytes(b"")
+    MKVLanguageDetector.clear_cache()
+    yield path
+    MKVLanguageDetector.clear_cache()
+
+
+def test_av_reader_reads_dispositions(mkv_file, monkeypatch):
+    """Test that PyAV tracks carry forced/default flags and skip ffprobe."""
+    streams = [
+        _subtitle_stream(2, "eng", disposition=0x0001),
+        _subtitle_stream(3, "spa", disposition=0x0040),
+    ]
+    monkeypatch.setattr(mkv_language_detector, "av", _fake_av(streams), raising=False)
+    monkeypatch.setattr(mkv_language_detector, "AV_AVAILABLE", True)
+    
+    with patch.object(subprocess, "run") as mock_run:
+        result = MKVLanguageDetector._probe_mkv_file(mkv_file)
+        mock_run.assert_not_called()
+    
+    assert [(t.index, t.language_code, t.default, t.forced) for t in result.subtitle_tracks] == [
+        (2, "eng", True, False),
+        (3, "spa", False, True),
+    ]
+
+
+def test_av_reader_without_disposition_uses_ffprobe(mkv_file, monkeypatch):
+    """Test that PyAV releases without Stream.disposition fall back to ffprobe."""
+    monkeypatch.setattr(mkv_language_detector, "av", _fake_av([_subtitle_stream(2, "eng")]), raising=False)
+    monkeypatch.setattr(mkv_language_detector, "AV_AVAILABLE", True)
+    
+    completed = subprocess.CompletedProcess([], 0, stdout=FFPROBE_OUTPUT, stderr=b"")
+    with patch.object(subprocess, "run", return_value=completed) as mock_run:
+        result = MKVLanguageDetector._probe_mkv_file(mkv_file)
+        mock_run.assert_called_once()
+    
+    track = result.subtitle_tracks[0]
+    assert track.default is True and track.forced is False
+
+
+def test_av_reader_errors(mkv_file, monkeypatch, caplog):
+    """Test that any PyAV failure falls back to ffprobe, logging unexpected ones."""
+    fake_av = _fake_av([])
+    monkeypatch.setattr(mkv_language_detector, "av", fake_av, raising=False)
+    monkeypatch.setattr(mkv_language_detector, "AV_AVAILABLE", True)
+    
+    fake_av.open.side_effect = _FakeFFmpegError("Invalid data found")
+    assert MKVLanguageDetector._read_subtitle_tracks_av(mkv_file) is None
+    assert not caplog.records
+    
+    fake_av.open.side_effect = UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+    completed = subprocess.CompletedProcess([], 0, stdout=FFPROBE_OUTPUT, stderr=b"")
+    with patch.object(subprocess, "run", return_value=completed) as mock_run:
+        result = MKVLanguageDetector.analyze_mkv_file(mkv_file)
+        mock_run.assert_called_once()
+    
+    assert result.error is None
+    assert [track.language_code for track in result.subtitle_tracks] == ["eng"]
+    assert "falling back to ffprobe" in caplog.text
+
+
+def test_ffprobe_output_parsed_from_bytes(mkv_file, monkeypatch):
+    """Test that ffprobe is asked for the read fields only and its bytes output is parsed."""
+    monkeypatch.setattr(mkv_language_detector, "AV_AVAILABLE", False)
+    
+    completed = subprocess.CompletedProcess([], 0, stdout=FFPROBE_OUTPUT, stderr=b"")
+    with patch.object(subprocess, "run", return_value=completed) as mock_run:
+        result = MKVLanguageDetector._probe_mkv_file(mkv_file)
+    
+    cmd = mock_run.call_args[0][0]
+    assert cmd[cmd.index("-show_entries") + 1] == mkv_language_detector._PROBE_ENTRIES
+    assert result.error is None
+    assert result.subtitle_tracks == [
+        SubtitleTrack(index=2, language_code="eng", language_name="English",
+                      title="Full", codec="subrip", forced=False, default=True)
+    ]
+
+
+def test_analysis_cache_invalidated_on_change(mkv_file):
+    """Test that cached analyses are reused until the file's size or mtime changes."""
+    analysis = MKVAnalysisResult(file_path=mkv_file, subtitle_tracks=[], has_subtitles=False)
+    
+    with patch.object(MKVLanguageDetector, "_probe_mkv_file", return_value=analysis) as mock_probe:
+        MKVLanguageDetector.analyze_mkv_file(mkv_file)
+        MKVLanguageDetector.analyze_mkv_file(mkv_file)
+        assert mock_probe.call_count == 1
+        
+        mkv_file.write_bytes(b"remuxed")
+        MKVLanguageDetector.analyze_mkv_file(mkv_file)
+        assert mock_probe.call_count == 2
+        
+        stat_result = mkv_file.stat()
+        os.utime(mkv_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+        MKVLanguageDetector.analyze_mkv_file(mkv_file)
+        assert mock_probe.call_count == 3
+
+
+def test_find_mkv_files(temp_dir):
+    """Test that MKV files are matched case-insensitively and directories skipped."""
+    for name in ("b.MKV", "a.mkv", "notes.txt"):
+        (temp_dir / name).write_bytes(b"")
+    (temp_dir / "extras.mkv").mkdir()
+    
+    assert [p.name for p in MKVLanguageDetector.find_mkv_files(temp_dir)] == ["a.mkv", "b.MKV"]
+
+
+def test_available_languages_sorted_by_display_name(temp_dir):
+    """Test that detected languages are ordered by display name, then code."""
+    for name in ("one.mkv", "two.mkv"):
+        (temp_dir / name).write_bytes(b"")
+    
+    def analyze(path):
+        codes = ["spa", "deu", "en"] if path.name == "one.mkv" else ["ENG", "fra", "xyz"]
+        tracks = [
+            SubtitleTrack(index=i, language_code=code, language_name="")
+            for i, code in enumerate(codes)
+        ]
+        return MKVAnalysisResult(file_path=path, subtitle_tracks=tracks, has_subtitles=True)
+    
+    with patch.object(MKVLanguageDetector, "analyze_mkv_file", side_effect=analyze):
+        result = MKVLanguageDetector.detect_languages_in_path(temp_dir)
+    
+    assert result.available_languages == [
+        ("en", "English"), ("eng", "English"), ("fra", "French"),
+        ("deu", "German"), ("spa", "Spanish"), ("xyz", "XYZ"),
+    ]
+
+
 def main():
     """Main test function."""
     print("SubtitleToolkit - MKV Language Detection Test")
@@ -39,7 +39,7 @@ class TestScriptRunner:
         assert runner._current_process is None
         assert runner._current_stage is None
         assert runner._current_config is None
-        assert runner._parser is not None
+        assert runner._parser_worker is not None
         assert runner._aggregator is None
         assert runner._process_start_time is None
         assert runner._termination_timer is not None
@@ -99,6 +99,21 @@ class TestScriptRunner:
                     runner = ScriptRunner()
                     assert runner._script_dir is not None
     
+    def test_script_directory_cached(self, qapp, temp_dir):
+        """Test that the scripts directory is resolved once and can be re-resolved on demand."""
+        from app.runner import script_runner
+        
+        ScriptRunner.reset_script_dir_cache()
+        with patch.object(script_runner.os, 'scandir', wraps=script_runner.os.scandir) as scandir:
+            first = ScriptRunner()._script_dir
+            calls = scandir.call_count
+            assert ScriptRunner()._script_dir == first
+            assert scandir.call_count == calls
+            
+            ScriptRunner.reset_script_dir_cache()
+            assert ScriptRunner()._script_dir == first
+            assert scandir.call_count > calls
+    
     @patch('app.runner.script_runner.sys.executable', '/usr/bin/python3')
     def test_run_extract_success(self, qapp, temp_dir, qt_signal_tester):
         """Test successful extract process execution."""
@@ -237,22 +252,43 @@ class TestScriptRunner:
             mock_process.setWorkingDirectory.assert_called_once()
             mock_process.start.assert_called_once()
     
-    def test_start_process_failed_to_start(self, qapp, temp_dir, mock_process):
-        """Test process start failure."""
+    def test_start_process_channel_mode(self, qapp, temp_dir, mock_process):
+        """Test that stdout/stderr are merged only when requested, and reset on reuse."""
         runner = ScriptRunner()
-        
         command = [sys.executable, "-c", "print('hello')"]
-        env_vars = {}
         
-        # Mock process that fails to start
-        mock_process.waitForStarted.return_value = False
+        with patch.object(runner, '_acquire_process', return_value=mock_process):
+            runner._start_process(command, {}, merge_channels=True)
+            mock_process.setProcessChannelMode.assert_called_with(QProcess.MergedChannels)
+            runner._cleanup_process()
+            
+            runner._start_process(command, {})
+            mock_process.setProcessChannelMode.assert_called_with(QProcess.SeparateChannels)
+        
+        assert ExtractConfig(input_directory=str(temp_dir)).merge_streams is False
+    
+    def test_start_process_failed_to_start(self, qapp, temp_dir, mock_process, qt_signal_tester):
+        """Test that a start failure is reported asynchronously via process_failed."""
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner.signals.process_failed.connect(qt_signal_tester.slot)
+        
+        command = [sys.executable, "-c", "print('hello')"]
         mock_process.errorString.return_value = "Failed to start"
         
-        with patch('PySide6.QtCore.QProcess') as MockQProcess:
-            MockQProcess.return_value = mock_process
-            
-            with pytest.raises(RuntimeError, match="Failed to start process"):
-                runner._start_process(command, env_vars)
+        with patch.object(runner, '_acquire_process', return_value=mock_process):
+            # start() returns immediately; no blocking wait for the child
+            process = runner._start_process(command, {})
+        
+        assert process is mock_process
+        mock_process.waitForStarted.assert_not_called()
+        
+        # Qt reports the failure through errorOccurred
+        runner._on_process_error(QProcess.FailedToStart)
+        
+        assert len(qt_signal_tester.received_signals) == 1
+        assert qt_signal_tester.received_signals[0][0][0] == Stage.EXTRACT
+        assert runner.is_running is False
     
     def test_process_stdout_handling(self, qapp, temp_dir, mock_process, qt_signal_tester):
         """Test processing of stdout data from subprocess."""
@@ -283,9 +319,8 @@ class TestScriptRunner:
         runner.signals.process_error_received.connect(qt_signal_tester.slot)
         
         # Mock stderr data
-        mock_data = Mock()
-        mock_data.data.return_value.decode.return_value = "Error message\n"
-        mock_process.readAllStandardError.return_value = mock_data
+        from PySide6.QtCore import QByteArray
+        mock_process.readAllStandardError.return_value = QByteArray(b"Error message\n")
         
         # Trigger stderr ready
         runner._on_stderr_ready()
@@ -293,12 +328,312 @@ class TestScriptRunner:
         # Should have emitted error signal
         assert len(qt_signal_tester.received_signals) >= 1
         assert qt_signal_tester.received_signals[0][0] == ("Error message\n",)
+
+    def test_stderr_without_receivers_logs_bounded_tail(self, qapp, temp_dir, mock_process, caplog):
+        """Test that unobserved stderr is only logged, as a bounded tail of the chunk."""
+        import logging
+        from PySide6.QtCore import QByteArray
+        from app.runner import script_runner
+        
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = mock_process
+        runner._debug_enabled = False
+        noise = b"x" * (script_runner._DEBUG_TEXT_LIMIT * 4) + b"final line"
+        mock_process.readAllStandardError.return_value = QByteArray(noise)
+        
+        with caplog.at_level(logging.WARNING, logger="app.runner.script_runner"):
+            runner._on_stderr_ready()
+        
+        message = caplog.records[-1].getMessage()
+        assert message.endswith("final line")
+        assert len(message) < script_runner._DEBUG_TEXT_LIMIT + 100
+    
+    def test_stderr_split_multibyte_character(self, qapp, temp_dir, mock_process, qt_signal_tester):
+        """Test that a UTF-8 character split across stderr reads is decoded intact."""
+        from PySide6.QtCore import QByteArray
+        
+        runner = ScriptRunner()
+        runner._current_process = mock_process
+        runner.signals.process_error_received.connect(qt_signal_tester.slot)
+        
+        encoded = "Грешка\n".encode("utf-8")
+        for chunk in (encoded[:3], encoded[3:]):
+            mock_process.readAllStandardError.return_value = QByteArray(chunk)
+            runner._on_stderr_ready()
+        
+        received = "".join(args[0] for args, _ in qt_signal_tester.received_signals)
+        assert received == "Грешка\n"
+
+    def test_stderr_truncated_tail_flushed_on_completion(self, qapp, temp_dir, mock_process, qt_signal_tester):
+        """Test that an incomplete UTF-8 sequence left on stderr is flushed at completion."""
+        from PySide6.QtCore import QByteArray
+        
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = mock_process
+        runner.signals.process_error_received.connect(qt_signal_tester.slot)
+        
+        mock_process.readAllStandardError.return_value = QByteArray("fail ж".encode("utf-8")[:-1])
+        runner._on_stderr_ready()
+        assert qt_signal_tester.received_signals[0][0] == ("fail ",)
+        
+        runner._completion_flag.test_and_set()
+        runner._complete_process_handling(1, QProcess.NormalExit)
+        assert qt_signal_tester.received_signals[1][0] == ("\ufffd",)
+
+    def test_events_batch_per_chunk(self, qapp, temp_dir, mock_process, qt_signal_tester):
+        """Test that events parsed from one stdout chunk arrive as one batch."""
+        from PySide6.QtCore import QByteArray
+        
+        runner = ScriptRunner()
+        runner._current_stage = Stage.TRANSLATE
+        runner._current_process = mock_process
+        runner.signals.events_batch_received.connect(qt_signal_tester.slot)
+        mock_process.bytesAvailable.return_value = 0
+        
+        lines = "".join(
+            f'{{"ts": "2025-08-08T07:42:01Z", "stage": "translate", "type": "progress", "msg": "Chunk {i}", "progress": {i * 10}}}\n'
+            for i in range(5)
+        )
+        mock_process.readAllStandardOutput.return_value = QByteArray(lines.encode())
+        runner._on_stdout_ready()
+        qt_signal_tester.wait_for_signal(runner.signals.events_batch_received)
+        
+        assert len(qt_signal_tester.received_signals) == 1
+        batch = qt_signal_tester.received_signals[0][0][0]
+        assert [event.progress for event in batch] == [0, 10, 20, 30, 40]
+
+    def test_secret_env_masking(self, qapp):
+        """Test masking of secret-looking environment variable values."""
+        assert ScriptRunner._mask_if_secret("OPENAI_API_KEY", "sk-1234567890abcdef") == "sk-12345***cdef"
+        assert ScriptRunner._mask_if_secret("AUTH_TOKEN", "short") == "***"
+        assert ScriptRunner._mask_if_secret("LANG", "en_US.UTF-8") == "en_US.UTF-8"
+        assert ScriptRunner._mask_if_secret("PROXY_PASSWORD", "hunter2") == "***"
+
+    def test_aggregator_reused_per_stage(self, qapp, temp_dir, mock_process):
+        """Test that each stage's aggregator is reset and reused across runs."""
+        runner = ScriptRunner()
+        command = [sys.executable, "-c", "pass"]
+        
+        with patch.object(runner, '_acquire_process', return_value=mock_process):
+            runner._current_stage = Stage.EXTRACT
+            runner._start_process(command, {})
+            first = runner._aggregator
+            first.add_event(Event(datetime.now(), Stage.EXTRACT, EventType.ERROR, "Boom"))
+            runner._cleanup_process()
+            
+            runner._current_stage = Stage.EXTRACT
+            runner._start_process(command, {})
+            assert runner._aggregator is first
+            assert first.errors == []
+            runner._cleanup_process()
+            
+            runner._current_stage = Stage.SYNC
+            runner._start_process(command, {})
+            assert runner._aggregator is not first
+            assert runner._aggregator.stage == Stage.SYNC
     
+    def test_process_environment_does_not_leak_between_starts(self, qapp, temp_dir):
+        """Test that stage variables are layered over a copy of the cached system environment."""
+        runner = ScriptRunner()
+        process = Mock(spec=QProcess)
+        command = [sys.executable, "script.py", "--jsonl"]
+        
+        with patch.object(runner, '_acquire_process', return_value=process):
+            runner._start_process(command, {"SUBTITLE_TOOLKIT_TEST_KEY": "first"})
+            first_env = process.setProcessEnvironment.call_args.args[0]
+            runner._cleanup_process()
+            
+            runner._start_process(command, {})
+            second_env = process.setProcessEnvironment.call_args.args[0]
+        
+        assert first_env.value("SUBTITLE_TOOLKIT_TEST_KEY") == "first"
+        assert not second_env.contains("SUBTITLE_TOOLKIT_TEST_KEY")
+        assert second_env.contains("PATH")
+    
+    def test_truncated_text(self):
+        """Test that large output blobs are cut before being sent to the debug log."""
+        from app.runner.script_runner import _truncated_text
+        
+        assert _truncated_text("short\n") == "short\n"
+        assert _truncated_text("x" * 10, limit=4) == "xxxx...(+6 chars)"
+
+    def test_debug_messages_gated(self, qapp, mock_process, qt_signal_tester):
+        """Test that internal debug messages are only emitted when enabled."""
+        runner = ScriptRunner()
+        runner.signals.debug_received.connect(qt_signal_tester.slot)
+
+        runner.debug_enabled = False
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = mock_process
+        runner._cleanup_process()
+        assert len(qt_signal_tester.received_signals) == 0
+
+        runner.debug_enabled = True
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = Mock(spec=QProcess)
+        runner._current_process.state.return_value = QProcess.NotRunning
+        runner._cleanup_process()
+        assert len(qt_signal_tester.received_signals) >= 1
+
+    def test_stdout_debug_mirrored_once_per_chunk(self, qapp, mock_process, qt_signal_tester):
+        """Test that a stdout chunk produces at most one debug message."""
+        from PySide6.QtCore import QByteArray
+
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = mock_process
+        runner.signals.debug_received.connect(qt_signal_tester.slot)
+        mock_process.bytesAvailable.return_value = 0
+        chunk = b"line one\nline two\nline three\n"
+
+        runner.debug_enabled = False
+        mock_process.readAllStandardOutput.return_value = QByteArray(chunk)
+        runner._on_stdout_ready()
+        assert len(qt_signal_tester.received_signals) == 0
+
+        runner.debug_enabled = True
+        mock_process.readAllStandardOutput.return_value = QByteArray(chunk)
+        runner._on_stdout_ready()
+        assert len(qt_signal_tester.received_signals) == 1
+        assert qt_signal_tester.received_signals[0][0][1] == "RAW_STDOUT: " + chunk.decode()
+
+    def test_output_receiver_tracking(self, qapp):
+        """Test that raw output receivers are tracked on connect/disconnect."""
+        runner = ScriptRunner()
+        assert runner.signals.has_output_receivers is False
+
+        slot = lambda data: None
+        runner.signals.process_output_received.connect(slot)
+        assert runner.signals.has_output_receivers is True
+
+        runner.signals.process_output_received.disconnect(slot)
+        assert runner.signals.has_output_receivers is False
+
+    def test_shared_slot_disconnect(self, qapp):
+        """Test that disconnecting a slot shared by two tracked signals updates both flags."""
+        runner = ScriptRunner()
+        received = []
+        runner.signals.process_output_received.connect(received.append)
+        runner.signals.event_received.connect(received.append)
+        assert runner.signals.has_output_receivers and runner.signals.has_event_receivers
+
+        runner.signals.process_output_received.disconnect(received.append)
+        assert runner.signals.has_output_receivers is False
+        assert runner.signals.has_event_receivers is True
+
+        runner.signals.event_received.disconnect(received.append)
+        assert runner.signals.has_event_receivers is False
+
+    def test_parsed_events_aggregated_as_batch(self, qapp, temp_dir):
+        """Test that one parsed chunk updates the aggregator with a single bulk call."""
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._parse_generation = 1
+        runner._aggregator = Mock()
+        events = [
+            Event(datetime.now(), Stage.EXTRACT, EventType.PROGRESS, f"Step {i}", progress=i * 10)
+            for i in range(3)
+        ]
+        
+        runner._on_events_parsed(1, "", [(event, None) for event in events])
+        
+        runner._aggregator.add_events.assert_called_once_with(events)
+        runner._aggregator.add_event.assert_not_called()
+    
+    def test_event_signals_skipped_without_receivers(self, qapp, temp_dir):
+        """Test that raw and batched event signals are only emitted when connected."""
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._parse_generation = 1
+        event = Event(timestamp=datetime.now(), stage=Stage.EXTRACT, event_type=EventType.INFO, message="Quiet")
+        
+        assert not runner.signals.has_event_receivers
+        assert not runner.signals.has_batch_receivers
+        with patch.object(runner.signals, 'event_received') as event_signal, \
+             patch.object(runner.signals, 'events_batch_received') as batch_signal:
+            runner._on_events_parsed(1, "", [(event, None)])
+        event_signal.emit.assert_not_called()
+        batch_signal.emit.assert_not_called()
+        
+        received = []
+        runner.signals.event_received.connect(received.append)
+        runner.signals.events_batch_received.connect(received.append)
+        assert runner.signals.has_event_receivers and runner.signals.has_batch_receivers
+        runner._on_events_parsed(1, "", [(event, None)])
+        assert received == [event, [event]]
+    
+    def test_output_tail_bounded(self, qapp, temp_dir, mock_process):
+        """Test that recent stdout is kept as a bounded raw tail and decoded on request."""
+        from PySide6.QtCore import QByteArray
+        from app.runner import script_runner
+        
+        runner = ScriptRunner()
+        runner._current_process = mock_process
+        mock_process.bytesAvailable.return_value = 0
+        chunk = b"y" * (script_runner._OUTPUT_TAIL_LIMIT // 4)
+        
+        for _ in range(10):
+            mock_process.readAllStandardOutput.return_value = QByteArray(chunk)
+            runner._on_stdout_ready()
+        mock_process.readAllStandardOutput.return_value = QByteArray("край\n".encode())
+        runner._on_stdout_ready()
+        
+        assert runner._output_tail_size < script_runner._OUTPUT_TAIL_LIMIT + len(chunk)
+        assert runner.get_output_tail().endswith("yyyкрай\n")
+        assert runner.get_output_tail(9) == "край\n"
+    
+    def test_stdout_bursts_coalesced(self, qapp, temp_dir, mock_process, qt_signal_tester):
+        """Test that several readyRead notifications in one tick cause a single drain."""
+        from PySide6.QtCore import QByteArray
+        
+        runner = ScriptRunner()
+        runner._current_process = mock_process
+        runner.signals.events_batch_received.connect(qt_signal_tester.slot)
+        mock_process.bytesAvailable.return_value = 0
+        mock_process.readAllStandardOutput.return_value = QByteArray(
+            b'{"ts": "2025-08-08T07:42:01Z", "stage": "extract", "type": "info", "msg": "Burst"}\n'
+        )
+        
+        for _ in range(5):
+            runner._schedule_stdout_drain()
+        mock_process.readAllStandardOutput.assert_not_called()
+        
+        qt_signal_tester.wait_for_signal(runner.signals.events_batch_received)
+        assert mock_process.readAllStandardOutput.call_count == 1
+        assert len(qt_signal_tester.received_signals) == 1
+    
+    def test_stdout_partial_line_buffering(self, qapp, temp_dir, mock_process, qt_signal_tester):
+        """Test that partial stdout lines are held back until a newline arrives."""
+        from PySide6.QtCore import QByteArray
+
+        runner = ScriptRunner()
+        runner._current_process = mock_process
+        runner.signals.event_received.connect(qt_signal_tester.slot)
+        mock_process.bytesAvailable.return_value = 0
+
+        line = '{"ts": "2025-08-08T07:42:01Z", "stage": "extract", "type": "info", "msg": "Split ж"}\n'.encode()
+        split_at = line.index("ж".encode()) + 1  # inside the multi-byte character
+
+        mock_process.readAllStandardOutput.return_value = QByteArray(line[:split_at])
+        runner._on_stdout_ready()
+        qt_signal_tester.wait_for_signal(runner.signals.event_received, timeout=100)
+        assert len(qt_signal_tester.received_signals) == 0
+
+        mock_process.readAllStandardOutput.return_value = QByteArray(line[split_at:])
+        runner._on_stdout_ready()
+        
+        # Parsing happens on the parser thread; the event arrives queued
+        qt_signal_tester.wait_for_signal(runner.signals.event_received)
+        assert len(qt_signal_tester.received_signals) == 1
+        assert qt_signal_tester.received_signals[0][0][0].message == "Split ж"
+
     def test_process_finished_success(self, qapp, temp_dir, qt_signal_tester):
         """Test handling successful process completion."""
         runner = ScriptRunner()
         runner._current_stage = Stage.EXTRACT
-        runner._process_start_time = datetime.now()
+        runner._process_start_time = time.monotonic()
         
         # Connect signals
         runner.signals.process_finished.connect(qt_signal_tester.slot)
@@ -321,7 +656,7 @@ class TestScriptRunner:
         """Test handling failed process completion."""
         runner = ScriptRunner()
         runner._current_stage = Stage.EXTRACT
-        runner._process_start_time = datetime.now()
+        runner._process_start_time = time.monotonic()
         
         # Connect signals
         runner.signals.process_finished.connect(qt_signal_tester.slot)
@@ -339,6 +674,71 @@ class TestScriptRunner:
         assert result.success is False
         assert result.exit_code == 1
     
+    def test_complete_process_handling_emits_result(self, qapp, temp_dir, qt_signal_tester):
+        """Test that completion handling emits a single process result."""
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._completion_flag.test_and_set()
+        
+        runner.signals.process_finished.connect(qt_signal_tester.slot)
+        
+        runner._complete_process_handling(0, QProcess.NormalExit)
+        
+        # The result is reported once the parser thread has flushed its buffer
+        qt_signal_tester.wait_for_signal(runner.signals.process_finished)
+        assert len(qt_signal_tester.received_signals) == 1
+        result = qt_signal_tester.received_signals[0][0][0]
+        assert result.success is True
+        assert result.stage == Stage.EXTRACT
+        assert runner._current_stage is None
+    
+    def test_failure_error_message_is_capped(self, qapp, temp_dir, qt_signal_tester):
+        """Test that only the first aggregated errors are joined into the result."""
+        from app.runner.events import EventAggregator
+        
+        runner = ScriptRunner()
+        runner._current_stage = Stage.TRANSLATE
+        runner._aggregator = EventAggregator(Stage.TRANSLATE)
+        runner._aggregator.errors.extend(f"error {i}" for i in range(25))
+        runner._completion_flag.test_and_set()
+        
+        runner.signals.process_finished.connect(qt_signal_tester.slot)
+        runner._complete_process_handling(1, QProcess.NormalExit)
+        qt_signal_tester.wait_for_signal(runner.signals.process_finished)
+        
+        result = qt_signal_tester.received_signals[0][0][0]
+        assert result.error_message.startswith("error 0; error 1;")
+        assert "error 20" not in result.error_message
+        assert result.error_message.endswith("error 19 (+5 more)")
+    
+    def test_run_rejected_while_completion_pending(self, qapp, temp_dir, mock_process, qt_signal_tester):
+        """Test that a new stage cannot start between process exit and completion."""
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = mock_process
+        mock_process.state.return_value = QProcess.NotRunning
+        runner.signals.process_finished.connect(qt_signal_tester.slot)
+
+        # Finish handled; the final drain and parser flush are still pending
+        runner._completion_flag.test_and_set()
+        assert runner.is_running is False
+
+        config = SyncConfig(input_directory=str(temp_dir), model="gpt-4o-mini", api_key="sk-test")
+        with patch.object(runner, '_start_process') as mock_start:
+            with pytest.raises(RuntimeError, match="Another process is already running"):
+                runner.run_sync(config)
+            mock_start.assert_not_called()
+        assert runner._current_stage == Stage.EXTRACT
+        assert runner._current_process is mock_process
+
+        runner._complete_process_handling(0, QProcess.NormalExit)
+        qt_signal_tester.wait_for_signal(runner.signals.process_finished)
+
+        assert [args[0].stage for args, _ in qt_signal_tester.received_signals] == [Stage.EXTRACT]
+        with patch.object(runner, '_start_process') as mock_start:
+            runner.run_sync(config)
+            mock_start.assert_called_once()
+
     def test_process_error_handling(self, qapp, temp_dir, qt_signal_tester):
         """Test handling process errors."""
         runner = ScriptRunner()
@@ -358,6 +758,55 @@ class TestScriptRunner:
         assert stage == Stage.EXTRACT
         assert "Failed to start process" in error_msg
     
+    def test_final_output_skips_empty_channels(self, qapp, temp_dir, mock_process):
+        """Test that the finish path only reads channels with buffered data."""
+        from PySide6.QtCore import QByteArray
+        
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = mock_process
+        mock_process.bytesAvailable.return_value = 0
+        
+        runner._read_final_output()
+        
+        mock_process.readAllStandardOutput.assert_not_called()
+        mock_process.readAllStandardError.assert_not_called()
+        # The read channel is restored to stdout after probing stderr
+        assert mock_process.setReadChannel.call_args_list[-1].args == (QProcess.StandardOutput,)
+        
+        runner._final_output_read = False
+        mock_process.bytesAvailable.side_effect = [0, 12, 0]  # stdout empty, stderr has data
+        mock_process.readAllStandardError.return_value = QByteArray(b"late warning")
+        
+        runner._read_final_output()
+        
+        mock_process.readAllStandardOutput.assert_not_called()
+        mock_process.readAllStandardError.assert_called()
+    
+    def test_process_crash_drains_output_before_failing(self, qapp, temp_dir, mock_process, qt_signal_tester):
+        """Test that events written just before a crash are delivered before process_failed."""
+        from PySide6.QtCore import QByteArray
+        
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = mock_process
+        mock_process.bytesAvailable.return_value = 0
+        mock_process.readAllStandardOutput.return_value = QByteArray(
+            b'{"ts": "2025-08-08T07:42:01Z", "stage": "extract", "type": "error", "msg": "Out of memory"}\n'
+        )
+        mock_process.readAllStandardError.return_value = QByteArray()
+        
+        order = []
+        runner.signals.error_received.connect(lambda stage, msg: order.append(("error", msg)))
+        runner.signals.process_failed.connect(lambda stage, msg: order.append(("failed", msg)))
+        runner.signals.process_failed.connect(qt_signal_tester.slot)
+        
+        runner._on_process_error(QProcess.Crashed)
+        qt_signal_tester.wait_for_signal(runner.signals.process_failed)
+        
+        assert order == [("error", "Out of memory"), ("failed", "Process crashed")]
+        assert runner._current_stage is None
+    
     def test_event_handling_info(self, qapp, temp_dir, qt_signal_tester):
         """Test handling of info events."""
         runner = ScriptRunner()
@@ -408,6 +857,29 @@ class TestScriptRunner:
         assert progress == 50
         assert message == "Processing files"
     
+    def test_progress_events_coalesced(self, qapp, temp_dir, qt_signal_tester):
+        """Test that rapid progress events are coalesced to the latest value."""
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner.signals.progress_updated.connect(qt_signal_tester.slot)
+        
+        for value in (10, 20, 30):
+            runner._handle_event(Event(
+                timestamp=datetime.now(),
+                stage=Stage.EXTRACT,
+                event_type=EventType.PROGRESS,
+                message=f"Step {value}",
+                progress=value
+            ))
+        
+        # First update goes out immediately, the rest are held back
+        assert len(qt_signal_tester.received_signals) == 1
+        assert qt_signal_tester.received_signals[0][0][1] == 10
+        
+        runner._flush_pending_progress()
+        assert len(qt_signal_tester.received_signals) == 2
+        assert qt_signal_tester.received_signals[1][0] == (Stage.EXTRACT, 30, "Step 30")
+    
     def test_event_handling_result(self, qapp, temp_dir, qt_signal_tester):
         """Test handling of result events."""
         runner = ScriptRunner()
@@ -516,7 +988,7 @@ class TestScriptRunner:
         """Test getting process info when running."""
         runner = ScriptRunner()
         runner._current_stage = Stage.EXTRACT
-        runner._process_start_time = datetime.now()
+        runner._process_start_time = time.monotonic()
         
         # Mock running process
         mock_process.state.return_value = QProcess.Running
@@ -530,12 +1002,71 @@ class TestScriptRunner:
         assert 'progress' in info
         assert 'parser_stats' in info
     
+    def test_get_process_info_progress_cached(self, qapp, temp_dir, mock_process):
+        """Test that progress info is reused until a new event arrives."""
+        from app.runner.events import EventAggregator
+        
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._aggregator = EventAggregator(Stage.EXTRACT)
+        mock_process.state.return_value = QProcess.Running
+        runner._current_process = mock_process
+        
+        first = runner.get_process_info()['progress']
+        assert runner.get_process_info()['progress'] is first
+        
+        runner._handle_event(Event(datetime.now(), Stage.EXTRACT, EventType.PROGRESS, "Halfway", progress=50))
+        updated = runner.get_process_info()['progress']
+        assert updated is not first
+        assert updated['progress'] == 50
+    
+    def test_get_process_info_parser_stats_snapshot(self, qapp, temp_dir, mock_process):
+        """Test that parser stats come from the worker's published snapshot."""
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        mock_process.state.return_value = QProcess.Running
+        runner._current_process = mock_process
+        worker = runner._parser_worker
+        
+        worker.parse(1, b'{"ts": "2025-08-08T07:42:01Z", "stage": "extract", "type": "info", "msg": "Stats"}\n')
+        
+        # The parser belongs to the parser thread and is not read directly
+        with patch.object(worker.parser, 'get_stats', side_effect=AssertionError("parser read across threads")):
+            stats = runner.get_process_info()['parser_stats']
+        assert stats['events_parsed'] == 1
+        
+        stats['events_parsed'] = 99
+        assert worker.get_stats()['events_parsed'] == 1
+    
+    def test_parser_worker_deleted_on_parser_thread(self, qapp):
+        """Test that a runner's parser worker is deleted on the parser thread with the runner."""
+        from PySide6.QtCore import QThread
+        from shiboken6 import Shiboken
+        from app.runner import script_runner
+        
+        parent = QObject()
+        runner = ScriptRunner(parent)
+        worker = runner._parser_worker
+        deleted_on = []
+        worker.destroyed.connect(
+            lambda *_: deleted_on.append(QThread.currentThread() is script_runner._parser_thread)
+        )
+        
+        Shiboken.delete(parent)
+        deadline = time.monotonic() + 2
+        while not deleted_on and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        
+        assert deleted_on == [True]
+        assert not Shiboken.isValid(worker)
+    
     def test_cleanup_process(self, qapp, temp_dir, mock_process):
         """Test process cleanup functionality."""
         runner = ScriptRunner()
         runner._current_stage = Stage.EXTRACT
         runner._current_process = mock_process
-        runner._process_start_time = datetime.now()
+        runner._process_start_time = time.monotonic()
         
         # Mock aggregator
         mock_aggregator = Mock()
@@ -550,8 +1081,51 @@ class TestScriptRunner:
         assert runner._aggregator is None
         assert runner._process_start_time is None
         
-        # Should have called deleteLater on process
+        # Finished process should be kept for reuse instead of deleted
+        mock_process.deleteLater.assert_not_called()
+        assert runner._acquire_process() is mock_process
+    
+    def test_cleanup_running_process_does_not_block(self, qapp, temp_dir, mock_process):
+        """Test that cleanup terminates a running process and kills it later without waiting."""
+        from app.runner import script_runner
+        
+        runner = ScriptRunner()
+        runner._current_stage = Stage.EXTRACT
+        runner._current_process = mock_process
+        mock_process.state.return_value = QProcess.Running
+        
+        with patch.object(script_runner.QTimer, 'singleShot') as single_shot:
+            runner._cleanup_process()
+        
+        assert runner._current_process is None
+        mock_process.terminate.assert_called_once()
+        mock_process.waitForFinished.assert_not_called()
+        mock_process.kill.assert_not_called()
+        assert mock_process not in runner._process_pool
+        
+        # The escalation kills the process only if terminate() was ignored
+        delay, reap = single_shot.call_args.args
+        assert delay == script_runner._CLEANUP_KILL_DELAY_MS
+        reap()
+        mock_process.kill.assert_called_once()
         mock_process.deleteLater.assert_called_once()
+    
+    def test_cleanup_process_pool_bounded(self, qapp, temp_dir):
+        """Test that cleanup deletes processes the pool has no room for."""
+        from app.runner import script_runner
+        
+        runner = ScriptRunner()
+        processes = []
+        for _ in range(script_runner._PROCESS_POOL_SIZE + 1):
+            process = Mock(spec=QProcess)
+            process.state.return_value = QProcess.NotRunning
+            processes.append(process)
+            runner._current_stage = Stage.EXTRACT
+            runner._current_process = process
+            runner._cleanup_process()
+        
+        assert len(runner._process_pool) == script_runner._PROCESS_POOL_SIZE
+        processes[-1].deleteLater.assert_called_once()
 
 
 @pytest.mark.unit
@@ -728,6 +1302,6 @@ class TestScriptRunnerErrorScenarios:
             runner._on_stdout_ready()
         
         # Parser should still be functional
-        stats = runner._parser.get_stats()
+        stats = runner._parser_worker.get_stats()
         assert stats['events_parsed'] >= 3  # Should have parsed the 3 valid events
         assert stats['parse_errors'] >= 2   # Should have recorded the 2 errors
\ No newline at end of file